@@ -0,0 +1,108 @@
+import argparse
+import json
+import os
+import tempfile
+
+import requests
+
+from car_paralel import CarsScraper, headers
+from mock_server import MockCarsServer
+
+# CarsScraper'ı, kayıtlı sayfaları yeniden oynatan yerel mock sunucuya karşı uçtan uca çalıştırır.
+# Ağ olmadan verim gerilemelerini ölçmek için: aynı ayarlarla iki sürümün çıktısını karşılaştırın.
+# 'baseline' motoru thread motorunu havuzsuz çalıştırır (her istek requests.request ile yeni
+# bağlantı açar); keep-alive'ın kazancı thread/async satırlarının ona oranıdır.
+
+
+class UnpooledSession:
+    """Havuzlu oturumdan önceki istemci: her istek modül düzeyindeki requests.request ile yapılır."""
+
+    def __init__(self, headers):
+        self.headers = headers
+
+    def get(self, url, headers=None, **kwargs):
+        return requests.request('GET', url, headers=headers or self.headers, **kwargs)
+
+
+def bench(engine, args):
+    server = MockCarsServer(pages=args.pages, dealers=args.dealers, latency=args.latency, jitter=args.jitter,
+                            error_rate=args.error_rate, throttle_rate=args.throttle_rate, retry_after=0,
+                            seed=args.seed, connect_latency=args.connect_latency)
+    with server:
+        scraper = CarsScraper(headers, concurrency=args.concurrency, extractor=args.extractor,
+                              initial_rate=args.rate, max_rate=args.rate,
+                              progress_interval=args.progress, metrics_path=None)
+        scraper.base_url = server.base_url + '/shopping/results/'
+        scraper.dealer_url = server.base_url + '/dealers/{customer_id}'
+        scraper.zip_codes = [10000 + i for i in range(args.zips)]
+        # Bağlantı kontrolü dış ağa gider; ölçtüğümüz şey bu değil
+        scraper.is_connected = lambda: True
+        # Hata enjeksiyonunda yeniden denemeler saniyeler yerine milisaniyeler beklesin
+        scraper.rate_limiter.settings.update(backoff_base=0.01, max_backoff=0.1)
+        scraper.print_summary = False
+        if engine == 'baseline':
+            scraper.fetcher.session = UnpooledSession(headers)
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                scraper.run(engine='thread' if engine == 'baseline' else engine)
+            finally:
+                os.chdir(cwd)
+
+        summary = scraper.summary
+        summary['server'] = dict(server.counts)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CarsScraper end to end against a local mock cars.com.")
+    parser.add_argument('--engines', nargs='+', default=['baseline', 'thread', 'async'],
+                        choices=['baseline', 'thread', 'async'],
+                        help="'baseline' is the thread engine with one connection per request (no keep-alive)")
+    parser.add_argument('--zips', type=int, default=50)
+    parser.add_argument('--pages', type=int, default=3, help="result pages per ZIP")
+    parser.add_argument('--dealers', type=int, default=300, help="distinct dealers across all ZIPs")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--extractor', default='fast', choices=['soup', 'fast'])
+    parser.add_argument('--rate', type=float, default=1000.0, help="request rate budget (req/s) for the scraper")
+    parser.add_argument('--latency', type=float, default=0.02, help="seconds of server-side delay per response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="extra random server delay (0..jitter seconds)")
+    parser.add_argument('--connect-latency', type=float, default=0.05,
+                        help="server delay per new connection, standing in for the TCP+TLS handshake")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of responses that are 503")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="fraction of responses that are 429")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--progress', type=float, default=1.0, help="live progress interval in seconds (0 disables)")
+    parser.add_argument('--summary', help="write the per-engine JSON summaries to this file")
+    args = parser.parse_args()
+
+    summaries = {}
+    for engine in args.engines:
+        summaries[engine] = bench(engine, args)
+
+    print()
+    baseline = summaries.get('baseline', {}).get('requests_per_sec')
+    print(f"{'engine':<8} {'requests':>9} {'dealers':>8} {'seconds':>8} {'req/s':>8} {'vs base':>8} {'conns':>6} {'MB':>7} "
+          f"{'search p50/p90':>15} {'dealer p50/p90':>15} {'parse ms':>9} {'retries':>8} {'throttles':>9}")
+    for engine, summary in summaries.items():
+        phases = summary['phases']
+        latency = {name: f"{phase['latency']['p50_ms'] or 0:.0f}/{phase['latency']['p90_ms'] or 0:.0f} ms"
+                   for name, phase in phases.items()}
+        parsed = [phase['parse'] for phase in phases.values() if phase['parse']['count']]
+        parse_ms = sum(p['mean_ms'] * p['count'] for p in parsed) / max(sum(p['count'] for p in parsed), 1)
+        gain = f"{summary['requests_per_sec'] / baseline:.2f}x" if baseline else '-'
+        print(f"{engine:<8} {summary['requests']:>9} {summary['rows_written']:>8} {summary['elapsed_sec']:>8.2f} "
+              f"{summary['requests_per_sec']:>8.1f} {gain:>8} {summary['server']['connections']:>6} {summary['bytes'] / 1e6:>7.1f} "
+              f"{latency.get('search', '-'):>15} {latency.get('dealer', '-'):>15} {parse_ms:>9.2f} "
+              f"{summary['retries']:>8} {summary['throttles']:>9}")
+
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            json.dump(summaries, f, indent=2)
+        print(f"Summaries written to {args.summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import argparse
+import glob
+import os
+import time
+import tracemalloc
+
+from extractors import EXTRACTORS
+
+# Kayıtlı sayfalar: search_*.html arama sonuçları, city_*.html şehir sayfaları,
+# sitemap_*.html şehir site haritası, dealer*.html bayi sayfalarıdır
+KINDS = ('search', 'city', 'sitemap')
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixtures(directory=FIXTURES_DIR):
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(directory, '*.html'))):
+        name = os.path.basename(path)
+        kind = next((kind for kind in KINDS if name.startswith(kind)), 'dealer')
+        with open(path, 'rb') as f:
+            fixtures.append((name, kind, f.read()))
+    return fixtures
+
+
+def extract(extractor, kind, content):
+    if kind == 'search':
+        return extractor.search_page(content)
+    if kind == 'city':
+        return extractor.city_zip(content)
+    if kind == 'sitemap':
+        return extractor.city_links(content)
+    return extractor.dealer_page(content, 'https://www.cars.com/dealers/0/')
+
+
+def measure(extractor, kind, content, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        extract(extractor, kind, content)
+    elapsed = time.perf_counter() - start
+
+    # Tek bir ayrıştırmanın en yüksek bellek kullanımı
+    tracemalloc.start()
+    extract(extractor, kind, content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return iterations / elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark page extractors on saved fixture pages.")
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--fixtures', default=FIXTURES_DIR)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    extractors = {name: cls() for name, cls in EXTRACTORS.items()}
+    mismatches = 0
+
+    print(f"{'fixture':<28} {'extractor':<9} {'KB':>6} {'pages/s':>9} {'peak KB':>9} {'speedup':>8}")
+    for name, kind, content in fixtures:
+        expected = extract(extractors['soup'], kind, content)
+        baseline = None
+        for extractor_name, extractor in extractors.items():
+            if extract(extractor, kind, content) != expected:
+                mismatches += 1
+                print(f"MISMATCH: {extractor_name} output differs from soup on {name}")
+            rate, peak = measure(extractor, kind, content, args.iterations)
+            baseline = baseline or rate
+            print(f"{name:<28} {extractor_name:<9} {len(content) / 1024:>6.0f} {rate:>9.1f} "
+                  f"{peak / 1024:>9.0f} {rate / baseline:>7.1f}x")
+
+    if mismatches:
+        raise SystemExit(f"{mismatches} extractor output mismatch(es)")
+
+
+if __name__ == "__main__":
+    main()
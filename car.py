@@ -1,47 +1,216 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
+import argparse
+import csv
+import os
+import queue
 import threading
 import time
-import csv
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+
+from cars_headers import headers
+from extractors import EXTRACTORS
+from fetcher import Fetcher
+from rate_control import HostRateLimiter
 
 base_url = "https://www.cars.com/sitemap/city-listings/"
 
-# Ana driver ile sayfayı aç
-main_driver = webdriver.Firefox()
-main_driver.get(base_url)
-input()
-soup = BeautifulSoup(main_driver.page_source, 'html.parser')
-city_links = ['https://www.cars.com'+a['href'] for a in soup.find_all('a', attrs={"data-linkname": "shopping-city"})]
-main_driver.quit()
-
-# 5 adet tarayıcı başlat
-drivers = [webdriver.Firefox() for _ in range(5)]
-semaphore = threading.Semaphore(5)  # Aynı anda maksimum 5 tarayıcının çalışmasını sağlar
-
-# Zip değerini belirli bir link için al
-def get_zip_from_link(link):
-    semaphore.acquire()  # Tarayıcı alındığında Semaphore'u kilitler
-    driver = drivers.pop()
-    driver.get(link)
-    time.sleep(3)  # Sayfanın tamamen yüklenmesini beklemek için
-
-    zip_input = driver.find_element(By.ID, 'zip-input')
-    zip_value = zip_input.get_attribute('value')
-    drivers.append(driver)  # Tarayıcıyı geri listeye ekler
-    semaphore.release()  # Tarayıcı bırakıldığında Semaphore'un kilidini açar
-    return (link, zip_value)
-
-with ThreadPoolExecutor(max_workers=5) as executor:
-    results = list(executor.map(get_zip_from_link, city_links))
-
-# Tarayıcıları kapat
-for driver in drivers:
-    driver.quit()
-
-# Sonuçları CSV dosyasına kaydet
-with open('results.csv', 'w', newline='') as file:
-    writer = csv.writer(file)
-    writer.writerow(["URL", "ZIP Value"])  # Başlık satırı
-    writer.writerows(results)
+
+class DriverPool:
+    """HTTP ile çözülemeyen sayfalar için headless Firefox havuzu.
+
+    Sürücüler ilk ihtiyaç anında başlatılır (hiç gerekmezse tarayıcı açılmaz) ve bir
+    kuyrukta paylaşılır. Sabit sleep yerine beklenen öğe hazır olana kadar beklenir.
+    """
+
+    def __init__(self, size=2, timeout=20):
+        self.size = size
+        self.timeout = timeout
+        self.idle = queue.Queue()
+        self.drivers = []
+        self.lock = threading.Lock()
+
+    def start_driver(self):
+        from selenium import webdriver
+
+        options = webdriver.FirefoxOptions()
+        options.add_argument('-headless')
+        driver = webdriver.Firefox(options=options)
+        driver.set_page_load_timeout(self.timeout)
+        return driver
+
+    @contextmanager
+    def driver(self):
+        try:
+            driver = self.idle.get_nowait()
+        except queue.Empty:
+            with self.lock:
+                start = len(self.drivers) < self.size
+                if start:
+                    print(f"Starting headless browser {len(self.drivers) + 1}/{self.size}...")
+                    try:
+                        driver = self.start_driver()
+                    except Exception:
+                        self.size = len(self.drivers)  # başlatılamıyorsa tekrar denenmez
+                        raise
+                    self.drivers.append(driver)
+            if not start:
+                if not self.drivers:
+                    raise RuntimeError("No browser available")
+                driver = self.idle.get()  # tüm sürücüler meşgul, biri boşalana kadar bekle
+        try:
+            yield driver
+        finally:
+            self.idle.put(driver)
+
+    def page_source(self, url, css_selector):
+        """Sayfayı açar ve `css_selector` öğesi görünene kadar bekleyip HTML'i döndürür."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        with self.driver() as driver:
+            driver.get(url)
+            WebDriverWait(driver, self.timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, css_selector)))
+            return driver.page_source
+
+    def zip_value(self, url):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        with self.driver() as driver:
+            driver.get(url)
+            # zip-input'un değeri sayfa yüklendikten sonra doldurulabilir; dolana kadar bekle
+            return WebDriverWait(driver, self.timeout).until(
+                lambda d: d.find_element(By.ID, 'zip-input').get_attribute('value'))
+
+    def close(self):
+        for driver in self.drivers:
+            driver.quit()
+        self.drivers = []
+
+
+class CityZipResolver:
+    """cars.com şehir sayfalarının ZIP değerlerini tarayıcısız, eşzamanlı olarak çözer.
+
+    Site haritası `links_path`'e, çözülen her şehir anında `output_path`'e yazılır;
+    yarıda kalan bir çalışma yeniden başlatıldığında yalnızca eksik şehirler istenir.
+    Tarayıcı havuzu (browsers > 0) yalnızca HTTP yanıtından ZIP çıkarılamazsa kullanılır.
+    """
+
+    def __init__(self, headers, workers=16, browsers=2, rate=10.0, output_path='results.csv',
+                 links_path='city_links.txt', extractor='fast'):
+        self.headers = headers
+        self.workers = workers
+        self.output_path = output_path
+        self.links_path = links_path
+        self.sitemap_url = base_url
+        self.extractor = EXTRACTORS[extractor]()
+        self.rate_limiter = HostRateLimiter(initial_rate=rate, max_rate=rate * 4)
+        self.fetcher = Fetcher(self.rate_limiter, concurrency=workers, headers=self.headers, retry_delay=2)
+        self.browsers = DriverPool(browsers) if browsers else None
+
+    def fetch(self, url, phase):
+        response = self.fetcher.fetch(url, phase=phase)
+        return response.content if response is not None else None
+
+    def load_city_links(self, resume=True):
+        """Şehir site haritasını okur; önceki çalışmanın listesi varsa onu kullanır."""
+        if resume and os.path.exists(self.links_path):
+            with open(self.links_path, encoding='utf-8') as f:
+                links = [line.strip() for line in f if line.strip()]
+            if links:
+                print(f"Loaded {len(links)} city links from {self.links_path}")
+                return links
+
+        content = self.fetch(self.sitemap_url, 'sitemap')
+        links = self.extractor.city_links(content, self.sitemap_url) if content else []
+        if not links and self.browsers:
+            print("Sitemap not readable over HTTP, falling back to browser...")
+            content = self.browsers.page_source(self.sitemap_url, 'a[data-linkname="shopping-city"]')
+            links = self.extractor.city_links(content, self.sitemap_url)
+        if not links:
+            raise RuntimeError(f"No city links found on {self.sitemap_url}")
+
+        with open(self.links_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(links) + '\n')
+        print(f"Found {len(links)} city links")
+        return links
+
+    def load_results(self):
+        # Önceki çalışmada ZIP'i çözülmüş şehirler
+        if not os.path.exists(self.output_path):
+            return {}
+        with open(self.output_path, newline='', encoding='utf-8') as f:
+            return {row['URL']: row['ZIP Value'] for row in csv.DictReader(f) if row.get('ZIP Value')}
+
+    def get_zip_from_link(self, link):
+        content = self.fetch(link, 'city')
+        zip_value = self.extractor.city_zip(content) if content else None
+        if not zip_value and self.browsers:
+            try:
+                zip_value = self.browsers.zip_value(link)
+            except Exception as e:
+                print(f"Browser fallback failed for {link}: {e}")
+        return link, zip_value
+
+    def write_results(self, links, results):
+        """Sonuçları site haritası sırasıyla yeniden yazar."""
+        tmp_path = self.output_path + '.tmp'
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(["URL", "ZIP Value"])  # Başlık satırı
+            writer.writerows((link, results[link]) for link in links if link in results)
+        os.replace(tmp_path, self.output_path)
+
+    def run(self, resume=True):
+        start = time.perf_counter()
+        links = self.load_city_links(resume)
+        results = self.load_results() if resume else {}
+        pending = [link for link in links if link not in results]
+        print(f"{len(links) - len(pending)} cities already resolved, {len(pending)} to go")
+
+        # Tamamlanan önceki sonuçlar korunarak dosya sitemap sırasıyla yeniden başlatılır
+        self.write_results(links, results)
+        failed = []
+        try:
+            with open(self.output_path, 'a', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    futures = [executor.submit(self.get_zip_from_link, link) for link in pending]
+                    for future in as_completed(futures):
+                        link, zip_value = future.result()
+                        if not zip_value:
+                            failed.append(link)
+                            continue
+                        results[link] = zip_value
+                        # Her sonuç anında diske yazılır; çökme durumunda kaybolmaz
+                        writer.writerow((link, zip_value))
+                        file.flush()
+        finally:
+            if self.browsers:
+                self.browsers.close()
+
+        self.write_results(links, results)
+        print(f"Resolved {len(results)}/{len(links)} cities in {time.perf_counter() - start:.1f}s "
+              f"({len(failed)} failed) -> {self.output_path}")
+        return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve the ZIP code of every cars.com city page.")
+    parser.add_argument('--workers', type=int, default=16, help="concurrent HTTP requests")
+    parser.add_argument('--browsers', type=int, default=2,
+                        help="headless browsers for pages HTTP cannot resolve (0 disables the fallback)")
+    parser.add_argument('--rate', type=float, default=10.0, help="initial requests per second")
+    parser.add_argument('--output', default='results.csv')
+    parser.add_argument('--links', default='city_links.txt', help="cached sitemap city links")
+    parser.add_argument('--fresh', action='store_true', help="ignore the cached sitemap and previous results")
+    args = parser.parse_args()
+
+    resolver = CityZipResolver(headers, workers=args.workers, browsers=args.browsers, rate=args.rate,
+                               output_path=args.output, links_path=args.links)
+    resolver.run(resume=not args.fresh)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,198 +1,570 @@
-import requests
-from bs4 import BeautifulSoup
-import json
+import os
 import time
+import math
+import shutil
+import hashlib
 import socket
+import sys
+import asyncio
+import threading
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
+from zip_planner import SEARCH_RADII, ZipPlanner, load_dealer_zips, print_report
+from frontier import Frontier
+from row_writer import RowWriter, export_excel
+from extractors import EXTRACTORS
+from rate_control import HostRateLimiter, NetworkHealth
+from fetcher import Fetcher
+from delta import compute_delta, dealer_hash
+from metrics import Metrics
+from cars_headers import headers
+
 
 class CarsScraper:
-    def __init__(self, headers):
-        self.results = []
+    def __init__(self, headers, concurrency=8, search_radius=None, frontier_path='frontier.db',
+                 output_path='dealers.csv', extractor='soup', initial_rate=5.0, max_rate=50.0,
+                 dealer_ttl=0, delta_path='dealers_delta.csv', verbose=False, progress_interval=1.0,
+                 metrics_path='metrics.json', max_dealer_attempts=3):
         self.headers = headers
+        # Hem ZIP hem bayi aşaması için tek eşzamanlılık sınırı
+        self.concurrency = concurrency
+        # Verilirse aramalar bu yarıçapla (mil) yapılır ve ZIP listesi planlayıcıyla küçültülür.
+        # Yalnızca sitenin kabul ettiği yarıçaplar geçerlidir; planlanan kapsama aranan yarıçapla aynı olur
+        if search_radius is not None and search_radius not in SEARCH_RADII:
+            raise ValueError(f"Unsupported search_radius: {search_radius!r} (expected one of {SEARCH_RADII})")
+        self.search_radius = search_radius
+        # Yarıda kalan çalışmaların kaldığı yerden devam edebilmesi için iş durumu
+        self.frontier_path = frontier_path
+        # Bayi satırları bu dosyaya akışla yazılır; biçim uzantıdan anlaşılır (.csv, .jsonl, .parquet)
+        self.output_path = output_path
+        # 'soup' tüm sayfayı ayrıştırır; 'fast' yalnızca gereken parçaları keser (aynı çıktı)
+        self.extractor = EXTRACTORS[extractor]()
+        # Yenileme taramasında son `dealer_ttl` saniyede kontrol edilmiş bayiler hiç istenmez
+        self.dealer_ttl = dealer_ttl
+        # Bu kadar çalışmada istenemeyen ya da ayrıştırılamayan bayiden vazgeçilir
+        # (yenileme taraması yine de tamamlanır)
+        self.max_dealer_attempts = max_dealer_attempts
+        self.delta_path = delta_path
         self.base_url = "https://www.cars.com/shopping/results/"
         self.dealer_url = "https://www.cars.com/dealers/{customer_id}"
         self.zip_codes = self.load_zip_codes()
+        # Host başına uyarlanabilir hız (istek/sn); sabit sleep'lerin yerini alır
+        self.rate_limiter = HostRateLimiter(initial_rate=initial_rate, max_rate=max_rate)
+        # Bağlantı her istekte yoklanmaz; yalnızca art arda bağlantı hatalarında devre açılır
+        self.network = NetworkHealth(self.is_connected)
+        # Sayfa/bayi başına satırlar yalnızca verbose modda yazılır; ilerleme canlı satırda görünür
+        self.verbose = verbose
+        self.progress_interval = progress_interval
+        self.metrics_path = metrics_path
+        # False ise çalışma sonu JSON özeti yazdırılmaz, yalnızca `metrics_path`'e kaydedilir
+        self.print_summary = True
+        self.metrics = Metrics()
+        # Her iki motor ve her iki aşama aynı havuzlu, yeniden denemeli istemciyi kullanır
+        self.fetcher = Fetcher(self.rate_limiter, self.metrics, self.network, concurrency=concurrency,
+                               headers=headers, log=self.log)
 
     def load_zip_codes(self):
         # ZIP kodlarını CSV dosyasından oku
         df = pd.read_csv('output.csv')
-        return df['ZIP CODE'].unique().tolist()
-    
+        zip_codes = df['ZIP CODE'].unique().tolist()
+        if self.search_radius is None:
+            return zip_codes
+
+        # Komşu ZIP'ler aynı bayileri döndürür; yarıçapı kapsayan asgari ZIP kümesini seç
+        # Önceki çıktı varsa planın kaç bilinen bayiyi kapsadığı da raporlanır
+        dealer_zips = load_dealer_zips(self.output_path) if os.path.exists(self.output_path) else None
+        search_zips, report = ZipPlanner().plan(self.search_radius, zip_codes, dealer_zips=dealer_zips)
+        print_report(report)
+        return search_zips
+
     def is_connected(self):
         """Bir internet bağlantısı olup olmadığını kontrol eder."""
         try:
             # Google DNS sunucusuna ping atmaya çalışıyoruz.
-            socket.create_connection(("8.8.8.8", 53))
-            return True
+            with socket.create_connection(("8.8.8.8", 53), timeout=3):
+                return True
         except OSError:
             pass
         return False
 
-    def retry_request(self, url, headers, params, max_retries=3, retry_delay=5):
-        for attempt in range(max_retries):
-            try:
-                # Eğer internet bağlantısı yoksa bekleyin.
-                while not self.is_connected():
-                    print("No internet connection. Retrying in 30 seconds...")
-                    time.sleep(30)
-
-                response = requests.request("GET", url, headers=headers, params=params, timeout=10)
-                return response
-            except requests.RequestException as e:
-                if attempt < max_retries - 1:  # i.e. not the last attempt
-                    print(f"Error occurred: {e}. Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                else:
-                    print(f"Error occurred: {e}. No more retries left. Returning None.")
-                    return None
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def parse_search_page(self, content, with_total=False):
+        """Arama sayfasından ilan href'lerini ve müşteri ID'lerini (ve istenirse toplam ilanı) çıkarır."""
+        return self.extractor.search_page(content, with_total)
+
+    def search_params(self, zip_code, page, page_size):
+        params = {
+            "page": str(page),
+            "page_size": str(page_size),
+            "zip": str(zip_code)
+        }
+        if self.search_radius is not None:
+            params["maximum_distance"] = str(self.search_radius)
+        return params
+
+    def resume_state(self, zip_code):
+        """Bir ZIP için frontier'da kayıtlı sayfalardan görülen href'leri ve sıradaki sayfayı döndürür."""
+        completed = self.frontier.completed_pages(zip_code)
+        return set().union(*completed.values()), max(completed, default=0) + 1
+
+    def discover_customer_ids(self, customer_ids):
+        # Yalnızca ilk kez görülen ID'ler için bayi isteği hemen kuyruğa alınır
+        for cid in self.frontier.add_customer_ids(customer_ids):
+            self.dispatch_dealer(cid)
+
+    def handle_search_page(self, zip_code, page, response, store_hrefs=False):
+        """Bir arama sayfasını işleyip frontier'a kaydeder; (href'ler, müşteri ID'leri, toplam ilan) döndürür."""
+        with self.metrics.parsing('search'):
+            # Toplam ilan sayısı yalnızca 1. sayfada gerekir ve aynı ayrıştırmadan okunur
+            if page == 1:
+                hrefs, customer_ids, total = self.parse_search_page(response.content, with_total=True)
+            else:
+                hrefs, customer_ids = self.parse_search_page(response.content)
+                total = None
+        # ID'ler sayfa tamamlanmış sayılmadan önce kaydedilir; arada kesilen bir çalışma sayfayı yeniden ister
+        self.discover_customer_ids(customer_ids)
+        self.frontier.complete_page(zip_code, page, hrefs if store_hrefs else None)
+        return hrefs, customer_ids, total
+
+    def fetch_search_page(self, zip_code, page, page_size, store_hrefs=False):
+        self.log(f"Processing page {page} for zip code {zip_code}")  # Hangi sayfa ve ZIP kodunun işlendiğini yazdır
+        response = self.fetcher.fetch(self.base_url, params=self.search_params(zip_code, page, page_size),
+                                      phase='search')
+        if response is None:
+            # Sayfa frontier'da bekliyor olarak kalır; sonsuz döngü yerine bir sonraki çalışmada denenir
+            print(f"Failed to fetch page {page} for zip code {zip_code} after retries.")
+            return None
+        return self.handle_search_page(zip_code, page, response, store_hrefs)
+
+    def finish_zip(self, zip_code, customer_ids, failed_pages):
+        if failed_pages:
+            print(f'{len(failed_pages)} page(s) failed for zip code {zip_code}; it will be retried on the next run.')
+        else:
+            self.frontier.complete_zip(zip_code)
+        self.metrics.adjust('zips', -1)
+        self.log(f'Fetched {len(customer_ids)} customer IDs for zip code {zip_code}.')  # Müşteri ID'leri alındı
+        return customer_ids
+
+    def collect_pages(self, zip_code, pages, results, customer_ids):
+        """Sayfa sonuçlarındaki müşteri ID'lerini toplar ve başarısız sayfaları döndürür.
+
+        İşlenirken hata veren sayfa (ör. bozuk datalayer JSON'u) da başarısız sayılır; böylece
+        ZIP diğer sayfalar beklenerek bekliyor olarak kalır ve sonraki çalışmada yeniden denenir.
+        """
+        failed_pages = []
+        for page, result in zip(pages, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result  # iptal ve kesintiler yutulmaz
+                print(f"Failed to process page {page} for zip code {zip_code}: {result!r}")
+                result = None
+            if result is None:
+                failed_pages.append(page)
+            else:
+                customer_ids.update(result[1])
+        return failed_pages
 
     def get_customer_ids(self, zip_code, page_size=100):
         customer_ids = set()
-        seen_hrefs = set()
-        page = 1
+        completed = self.frontier.completed_pages(zip_code)
+        page_count = self.frontier.page_count(zip_code)
 
-        while True:
-            params = {
-                "page": str(page),
-                "page_size": str(page_size),
-                "zip": str(zip_code)
-            }
-            print(f"Processing page {page} for zip code {zip_code}")  # Hangi sayfa ve ZIP kodunun işlendiğini yazdır
-
-            response = self.retry_request(self.base_url, self.headers, params)
-            if response is None:
-                print("Failed to fetch the page after retries. Skipping to the next page.")
-                continue
+        if page_count is None:
+            # Toplam ilan sayısını 1. sayfadan oku ve kesin sayfa sayısını hesapla
+            first = self.fetch_search_page(zip_code, 1, page_size)
+            if first is None:
+                return self.finish_zip(zip_code, customer_ids, [1])
+            hrefs, customer_ids, total = first
+            if total is None:
+                return self.get_customer_ids_sequentially(zip_code, page_size, hrefs, customer_ids)
+            page_count = math.ceil(total / page_size)
+            self.frontier.set_page_count(zip_code, page_count)
+            completed[1] = hrefs
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Sayfadaki href özelliklerini topla
-            current_page_hrefs = set(a['href'] for a in soup.find_all('a', class_='vehicle-card-link js-gallery-click-link', href=True))
+        # Kalan sayfaları global istek sınırı içinde eşzamanlı iste
+        remaining = [page for page in range(1, page_count + 1) if page not in completed]
+        futures = [self.page_executor.submit(self.fetch_search_page, zip_code, page, page_size) for page in remaining]
+        # exception() sonucu bekler; kesintide iptal edilen sayfalarda CancelledError yükseltir
+        results = [future.exception() or future.result() for future in futures]
+        failed_pages = self.collect_pages(zip_code, remaining, results, customer_ids)
+        return self.finish_zip(zip_code, customer_ids, failed_pages)
+
+    def get_customer_ids_sequentially(self, zip_code, page_size, first_hrefs, customer_ids):
+        """Toplam ilan sayısı okunamadığında, yeni ilan gelmeyene kadar sayfa sayfa ilerler."""
+        self.frontier.complete_page(zip_code, 1, first_hrefs)
+        seen_hrefs, page = self.resume_state(zip_code)
+
+        while True:
+            result = self.fetch_search_page(zip_code, page, page_size, store_hrefs=True)
+            if result is None:
+                return self.finish_zip(zip_code, customer_ids, [page])
+            current_page_hrefs, page_customer_ids, _ = result
 
             # Eğer bu sayfadaki href'ler önceki sayfalarda görülmüşse, döngüyü durdur
             if current_page_hrefs.issubset(seen_hrefs):
-                print(f'No new listings on page {page} for zip code {zip_code}. Stopping...')  # Yeni listeleme yok, durduruluyor
+                self.log(f'No new listings on page {page} for zip code {zip_code}. Stopping...')  # Yeni listeleme yok, durduruluyor
                 break
-            
+
             # Aksi takdirde, href'leri seen_hrefs kümesine ekle
             seen_hrefs.update(current_page_hrefs)
-            
-            # Müşteri ID'lerini topla (Eğer müşteri ID'lerini almak istiyorsanız)
-            a = soup.find("cars-datalayer", attrs={"store": "als"})
-            if a:
-                data = json.loads(a.text)
-                for entry in data:
-                    for vehicle in entry['vehicle_array']:
-                        customer_ids.add(vehicle['customer_id'])
-            
-            time.sleep(0.5)
-            
+            customer_ids.update(page_customer_ids)
+
             # Sayfa numarasını arttır
             page += 1
-            
-        
-        print(f'Fetched {len(customer_ids)} customer IDs for zip code {zip_code}.')  # Müşteri ID'leri alındı
-        return customer_ids
+
+        return self.finish_zip(zip_code, customer_ids, [])
+
+    async def fetch_search_page_async(self, session, zip_code, page, page_size, store_hrefs=False):
+        self.log(f"Processing page {page} for zip code {zip_code}")
+        response = await self.fetcher.fetch_async(session, self.base_url,
+                                                  params=self.search_params(zip_code, page, page_size), phase='search')
+        if response is None:
+            print(f"Failed to fetch page {page} for zip code {zip_code} after retries.")
+            return None
+        # Ayrıştırma ve SQLite yazımları olay döngüsünü bloklamasın
+        return await asyncio.to_thread(self.handle_search_page, zip_code, page, response, store_hrefs)
+
+    async def get_customer_ids_async(self, session, zip_code, page_size=100):
+        """get_customer_ids'in asyncio karşılığı; sayfalama mantığı aynıdır."""
+        customer_ids = set()
+        completed = await asyncio.to_thread(self.frontier.completed_pages, zip_code)
+        page_count = await asyncio.to_thread(self.frontier.page_count, zip_code)
+
+        if page_count is None:
+            first = await self.fetch_search_page_async(session, zip_code, 1, page_size)
+            if first is None:
+                return await asyncio.to_thread(self.finish_zip, zip_code, customer_ids, [1])
+            hrefs, customer_ids, total = first
+            if total is None:
+                return await self.get_customer_ids_sequentially_async(session, zip_code, page_size, hrefs, customer_ids)
+            page_count = math.ceil(total / page_size)
+            await asyncio.to_thread(self.frontier.set_page_count, zip_code, page_count)
+            completed[1] = hrefs
+
+        remaining = [page for page in range(1, page_count + 1) if page not in completed]
+        # Hata veren bir sayfa diğerlerini yarıda bırakmaz; tüm sayfalar beklenir
+        results = await asyncio.gather(*(self.fetch_search_page_async(session, zip_code, page, page_size)
+                                         for page in remaining), return_exceptions=True)
+        failed_pages = self.collect_pages(zip_code, remaining, results, customer_ids)
+        return await asyncio.to_thread(self.finish_zip, zip_code, customer_ids, failed_pages)
+
+    async def get_customer_ids_sequentially_async(self, session, zip_code, page_size, first_hrefs, customer_ids):
+        await asyncio.to_thread(self.frontier.complete_page, zip_code, 1, first_hrefs)
+        seen_hrefs, page = await asyncio.to_thread(self.resume_state, zip_code)
+
+        while True:
+            result = await self.fetch_search_page_async(session, zip_code, page, page_size, store_hrefs=True)
+            if result is None:
+                return await asyncio.to_thread(self.finish_zip, zip_code, customer_ids, [page])
+            current_page_hrefs, page_customer_ids, _ = result
+
+            if current_page_hrefs.issubset(seen_hrefs):
+                self.log(f'No new listings on page {page} for zip code {zip_code}. Stopping...')
+                break
+
+            seen_hrefs.update(current_page_hrefs)
+            customer_ids.update(page_customer_ids)
+            page += 1
+
+        return await asyncio.to_thread(self.finish_zip, zip_code, customer_ids, [])
 
     def process_zip_code(self, zip_code):
-        print(f'Processing zip code {zip_code}...')  # ZIP kodu işleniyor
+        self.log(f'Processing zip code {zip_code}...')  # ZIP kodu işleniyor
         customer_ids = self.get_customer_ids(zip_code)
         return customer_ids  # Her ZIP kodu için elde edilen müşteri ID'lerini döndür
 
+    def parse_dealer_page(self, content, url):
+        """Bayi sayfasından bayi bilgilerini çıkarır; bayi adı yoksa None döndürür."""
+        return self.extractor.dealer_page(content, url)
+
+    def is_fresh(self, state):
+        """Bayi son `dealer_ttl` saniye içinde kontrol edildiyse yeniden istenmez."""
+        return bool(self.dealer_ttl and state and state['checked_at']
+                    and time.time() - state['checked_at'] < self.dealer_ttl)
+
+    def conditional_headers(self, state):
+        headers = dict(self.headers)
+        if state and state['etag']:
+            headers['If-None-Match'] = state['etag']
+        if state and state['last_modified']:
+            headers['If-Modified-Since'] = state['last_modified']
+        return headers
+
+    def complete_dealer(self, customer_id, result, meta=None):
+        if result:
+            # Satır yazıldıktan sonra writer bayiyi frontier'da tamamlandı olarak işaretler
+            self.writer.put(customer_id, result, meta)
+        else:
+            self.frontier.complete_dealer(customer_id, None, meta)
+
+    def handle_dealer_response(self, customer_id, state, response):
+        now = time.time()
+        if response.status_code == 304 and state:
+            # Sayfa değişmemiş: son sonucu yeniden kullan, yalnızca kontrol zamanını güncelle
+            self.complete_dealer(customer_id, state['result'], {'checked_at': now})
+            return state['result']
+
+        body_hash = hashlib.sha1(response.content).hexdigest()
+        if state and state['body_hash'] == body_hash:
+            result = state['result']  # aynı içerik, yeniden ayrıştırmaya gerek yok
+        else:
+            try:
+                with self.metrics.parsing('dealer'):
+                    result = self.parse_dealer_page(response.content, response.url)
+            except Exception as e:
+                # Ayrıştırılamayan sayfa da istenemeyen sayfa gibi bayinin deneme hakkından düşer
+                print(f"Failed to parse dealer page for customer ID {customer_id}: {e!r}")
+                self.fail_dealer(customer_id, state)
+                return None
+
+        content_hash = dealer_hash(result) if result else None
+        if state and state['content_hash'] and content_hash != state['content_hash']:
+            # Satırı son kontrolden bu yana değişen bayi; fark dosyasını beklemeden sayılır
+            self.changed_dealers.add(customer_id)
+            self.log(f'Dealer {customer_id} changed since it was last checked.')
+
+        meta = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body_hash': body_hash,
+            'content_hash': content_hash,
+            'checked_at': now,
+        }
+        self.complete_dealer(customer_id, result, meta)
+        return result
+
+    def fail_dealer(self, customer_id, state):
+        if not self.frontier.fail_dealer(customer_id, self.max_dealer_attempts):
+            return  # frontier'da bekliyor olarak kalır, sonraki çalışmada tekrar denenir
+        print(f'Giving up on dealer {customer_id} after {self.max_dealer_attempts} failed runs.')
+        if state and state['result']:
+            # Önceki sonuç yeni görüntüye taşınır; fark bu bayiyi kaybolmuş olarak göstermez
+            self.writer.put(customer_id, state['result'], {'carried_over': True})
+
     def request_dealer_page(self, customer_id):
-        print(f'Requesting dealer page for customer ID {customer_id}...')  # Bayi sayfası isteniyor
-
-        url = self.dealer_url.format(customer_id=customer_id)
-        response = requests.request("GET", url, headers=self.headers)
-
-        soup = BeautifulSoup(response.content, 'html.parser')
-    
-        dealer_name = (found := soup.find('h1', class_='sds-heading--1 dealer-heading')) and found.text.strip()
-
-        if not dealer_name:
-            return
-
-        # dealer_website'i çekme
-        dealer_website_tag = soup.find('a', {'data-connection-intent-id': 'dealer-profile-page-website-transfer'})
-        dealer_website = dealer_website_tag['href'] if dealer_website_tag else None
-
-        # dealer_address ve dealer_direction_link'i çekme
-        direction_tag = soup.find('a', {'data-connection-intent-id': 'dealer-directions-connection'})
-        dealer_direction_link = direction_tag['href'] if direction_tag else None
-        dealer_address = direction_tag['aria-label'] if direction_tag else None
-        
-        # Telefon numaralarını çekme
-        result = {
-                "dealer_name": dealer_name,
-                "dealer_website": dealer_website,
-                "dealer_direction_link": dealer_direction_link,
-                "dealer_address": dealer_address,
-                "URL": response.url.strip()
-                }
-
-        phones = soup.find_all("div", class_="dealer-phone")
-
-        for phone in phones:
-            title = phone.find("span", class_="phone-number-title").text.strip()
-            # Eğer title boşsa "Used" olarak değiştir
-            if not title:
-                title = "Used"
-            number = phone.find("a", class_="phone-number").text.strip()
-            result[title] = number
-
-        print(result)
-        
-        self.results.append(result)
-        # İsteğin sonuçlarını işleme
-        # ...
+        self.log(f'Requesting dealer page for customer ID {customer_id}...')  # Bayi sayfası isteniyor
+        try:
+            state = self.frontier.dealer_state(customer_id)
+            if self.is_fresh(state):
+                self.complete_dealer(customer_id, state['result'])
+                return
+
+            url = self.dealer_url.format(customer_id=customer_id)
+            response = self.fetcher.fetch(url, self.conditional_headers(state), phase='dealer')
+            if response is None:
+                self.fail_dealer(customer_id, state)
+                return
+
+            result = self.handle_dealer_response(customer_id, state, response)
+            if result:
+                self.log(result)
+        finally:
+            self.metrics.adjust('dealers', -1)
+
+    async def request_dealer_page_async(self, session, customer_id):
+        self.log(f'Requesting dealer page for customer ID {customer_id}...')
+        try:
+            state = await asyncio.to_thread(self.frontier.dealer_state, customer_id)
+            if self.is_fresh(state):
+                await asyncio.to_thread(self.complete_dealer, customer_id, state['result'])
+                return
+
+            url = self.dealer_url.format(customer_id=customer_id)
+            response = await self.fetcher.fetch_async(session, url, self.conditional_headers(state), phase='dealer')
+            if response is None:
+                await asyncio.to_thread(self.fail_dealer, customer_id, state)
+                return
+
+            result = await asyncio.to_thread(self.handle_dealer_response, customer_id, state, response)
+            if result:
+                self.log(result)
+        finally:
+            self.metrics.adjust('dealers', -1)
+
     def save_to_excel(self, filename="dealers.xlsx"):
-        df = pd.DataFrame(self.results)
-        df.to_excel(filename, index=False)
-
-    def run(self):
-        all_customer_ids = set()  # Tüm müşteri ID'lerini bu kümede topla
-        print('Starting to process zip codes...')  # ZIP kodları işlenmeye başlanıyor
-
-        with ThreadPoolExecutor() as executor:
-            # Paralel olarak her ZIP kodu için get_customer_ids metodunu çalıştır
-            results = executor.map(self.process_zip_code, self.zip_codes)
-        
-        # Sonuçları all_customer_ids kümesine ekle
-        for customer_ids in results:
-            all_customer_ids.update(customer_ids)
-        
+        # İsteğe bağlı son işlem: Excel, akışla yazılmış çıktı dosyasından üretilir
+        export_excel(self.output_path, filename)
+
+    def save_customer_ids(self, all_customer_ids, filename='customer_ids.txt'):
         # all_customer_ids kümeyi bir txt dosyasına kaydet
-        with open('customer_ids.txt', 'w') as f:
+        with open(filename, 'w') as f:
             for cid in all_customer_ids:
                 f.write(str(cid) + '\n')
 
-        print('Starting to request dealer pages...')  # Bayi sayfaları istenmeye başlanıyor
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            executor.map(self.request_dealer_page, all_customer_ids)  # Paralel olarak her müşteri ID'si için dealer sayfasını iste
-
-        self.save_to_excel()
-
-
-# Headers tanımı (Örneğin: User-Agent, vs.)
-headers = {
-  'authority': 'www.cars.com',
-  'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-  'accept-language': 'tr-TR,tr;q=0.9',
-  'cache-control': 'max-age=0',
-  'cookie': 'ToyotaNewAd=false; CARS_als_loaded=true; CARS_experience_testing={"session_id":"3d53dc31-6f9c-4ea8-8ad4-bf47d09bb026","tnt_id":"3d53dc31-6f9c-4ea8-8ad4-bf47d09bb026.34_0"}; CARS_has_visited=; CARS_logged_in=false; CARS_trip_id=e34b8329-2dbb-4d56-919d-b1853d1f2d5d; bm_sz=F2CC5771C85DE8C2AA6B4A355267D36F~YAAQvoYUAg6SL/iKAQAAGOGJChWmC5UvDuqtSUW1yeAsPKywTi3rmDXbeIoBszEJ4XeMKnMAtYPjFxHh9NUR4Xi8SMC8K7aFkvKScZ9ySBdihkWpxVgxDU/G64SD2w+FmlzeGdrnSJLHxgotqxpDFJNTpBOAc4AAYDO++BBJRRzY8vYXNpW4MeaxwXfbYsllrEkYVqyUTYzNBE5qFRKRcX96lFQYHaYkCRC+hONL+igGrpgICfayqw9iIWkbY3YblEeMQQOlxneaJ1TvqDrTKIT/0wuDO4dsT28zns/ge/D0~3293762~3618116; CARS_navClick=; ak_bmsc=E7F0BE88D5FC808A0E9BAAD044830816~000000000000000000000000000000~YAAQvoYUAj2SL/iKAQAA6emJChUjSfHF3j3BLeJIrGUqIk8Qyrw7eb2negnnwOFQAC0yynm3CS/VoJlioK+REA1ei01gtjlubZfF7sDrSDiL+U/JC5ARB6bpLu5bPT/gYyoLvPr9naPkiRLiSPr3rbTCda08nTGi3DBKBqeUd7T6D9zh5SqO/yMrdR8zQSIvUNPyLFbd9fkxzGJJpxRetAUzwIjWSIcbNxaqBu3Yit+/aLzEsWf626OMLO1+f7UQRbQ/0P8iN/tgUE4YNgWD4ocscTrmmJ/cw9oA/KeeglKCOFWSSfDz3D6HjckGmqZr7liH2ymxjJoo4M2VAhyy3dSQ+j1gWJxdeXvRIIRu7fS+bxdAX2Vz7UU9fi1nKgjXhseG1sUIUHATAee/pInsEN58AWVMu7U66NUbbdLIblSM1A+TEET38yxi46RpLpmPPppCx+j8R2J7kYEZpjlAFSj1pgaLJCiIh17567r0VPzCVq+Hs/P3B1OPlP4g; s_ecid=MCMID%7C23143105766679683772866057691083138844; AMCVS_C78C1CFE532E6E2E0A490D45%40AdobeOrg=1; _cs_mk_aa=0.022461580964973082_1696688893476; AMCV_C78C1CFE532E6E2E0A490D45%40AdobeOrg=1176715910%7CMCIDTS%7C19638%7CMCMID%7C23143105766679683772866057691083138844%7CMCAID%7CNONE%7CMCOPTOUT-1696696091s%7CNONE%7CMCAAMLH-1697293691%7C6%7CMCAAMB-1697293691%7Cj8Odv6LonN4r3an7LhD3WZrU1bUpAkFkkiY1ncBR96t2PTI%7CMCSYNCSOP%7C411-19645%7CvVersion%7C5.4.0; s_lv_s=First%20Visit; s_inv=0; s_cc=true; _gid=GA1.2.849265699.1696688897; _gcl_au=1.1.2097986781.1696688897; _pin_unauth=dWlkPVltUXdNamN6TmpVdE5tVmtZaTAwTkdSaExUZ3pNVFF0WVdOak5UUXdNbVE0WW1ZMw; ToyotaNewAd=false; di_roxanne__visit_id=8057982562; di_roxanne__visitor_id=12250551822; _aeaid=55e8b292-2da5-4c84-913c-bb19c0ceac90; aelastsite=RVHvE4glMR0sC5iYWBair1aiHO0Ez37924foGSUCRDBlkWrbrSt4Qc%2BBnB7QmaV7; aelreadersettings=%7B%22c_big%22%3A0%2C%22rg%22%3A0%2C%22memph%22%3A0%2C%22contrast_setting%22%3A0%2C%22colorshift_setting%22%3A0%2C%22text_size_setting%22%3A0%2C%22space_setting%22%3A0%2C%22font_setting%22%3A0%2C%22k%22%3A0%2C%22k_disable_default%22%3A0%2C%22hlt%22%3A0%2C%22disable_animations%22%3A0%2C%22display_alt_desc%22%3A0%7D; iovoxMCM=other; iovox_sea=eyJmaXJzdF92aXNpdCI6IjIwMjMtMTAtMDdUMTQ6MzA6MDcuOTczWiIsInJlZmVyZXJfcGFnZSI6Imh0dHBzOi8vd3d3LmNhcnMuY29tL3Nob3BwaW5nL2FsYmFueS1ueS8iLCJmaXJzdF9wYWdlIjoiaHR0cHM6Ly93d3cuY2Fycy5jb20vdmVoaWNsZWRldGFpbC9jZjNiMDVkMS1hMjE1LTRiNjAtYTAzYi0yNDU1NDIxZDkzNGMvIn0=; iovox_id=e7697b26-63e4-48db-a842-dfdf013730f2; _abck=9A88A1203CBFC2CDB9A90DBBF2618196~0~YAAQvoYUAr1uMPiKAQAACxGjCgoKqTBn5aR8FXoonl/qwkwFezjC9cu7eE1aLMYdhadJ90r5/nAKzwCZctSEtYX95QnjYYaKblUB5R4l/h9f6+RTK7XS8Q2/lFeVoACxYir+5sc8v8NQBKT61fiCzaIu/iBVjx2RCup/LwQaYLDW5y3KoFkK7uxTdR3LzN7Ui/d3I77XyVY/hSSaokMU9ftdpEg+k84+PZ9JWj1PJuhS+P5o/kO8mSyvbHtQUgoivAu6XNn6VBPt+tKtORZBffb73aS47L36Ht7wsX6LfbVnr5KOGkWGz49jVGssFNg9vYVSPTMm2OrAnu1W+bRPUI7G9yEAQTcyFPk8cX5JL+kLm7sE5c+dxv64djNetyaRsuyZ5LSSJ3877TXlF37ghh/LobaGr7c=~-1~-1~-1; s_sq=%5B%5BB%5D%5D; _gat_gtag_UA_50492232_1=1; CARS_marketing_source=SFMyNTY.g2gDdAAAAARkAApfX3N0cnVjdF9fZAAjRWxpeGlyLkNhcnNXZWIuUGx1Zy5NYXJrZXRpbmdTb3VyY2VkAAhhZmZfY29kZW0AAAAGc2VvYWZmZAAMY2xpY2tfc291cmNldAAAAABkAAN1dG10AAAAC2QACl9fc3RydWN0X19kACVFbGl4aXIuQ2Fyc1dlYi5TaXRlQWN0aXZpdHkuVVRNUGFyYW1zZAAMdXRtX2NhbXBhaWduZAADbmlsZAAPdXRtX2NhbXBhaWduX2lkZAADbmlsZAALdXRtX2NvbnRlbnRkAANuaWxkABV1dG1fZmlyc3Rfc2Vzc2lvbl9oaXRkAAVmYWxzZWQACnV0bV9tZWRpdW1kAANuaWxkAAx1dG1fbW9kaWZpZWRkAAR0cnVlZAAOdXRtX3NldF9tZXRob2RtAAAAC3JlZmVyZXJfdXJsZAAKdXRtX3NvdXJjZWQAA25pbGQACHV0bV90ZXJtZAADbmlsZAALdXRtX3RydXN0ZWRkAAR0cnVlbgYAfkOkCosBYgABUYA.aG3_Y2mc29_YmtzeWsGdCvPXW-oC-hOpFw2O_r-69oQ; CARS_search_session=SFMyNTY.g2gDdAAAAAVkAApfX3N0cnVjdF9fZAAhRWxpeGlyLkNhcnNXZWIuUGx1Zy5TZWFyY2hTZXNzaW9uZAASc2VhcmNoX2luc3RhbmNlX2lkbQAAACQ4Y2ZiOWFhNS0wYmM0LTQwMGQtOWRhNS1iNDgzZmI0NmQ1M2NkABJzZWFyY2hfbGlzdGluZ19pZHNkAANuaWxkAA1zZWFyY2hfcGFyYW1zZAADbmlsZAAOc2VhcmNoX3ppcGNvZGVtAAAABTEyMjA2bgYAfUOkCosBYgABUYA.rhE1p9xZ_mITkZZiRJJhTJQ4XgeezKHRvGXVtSlZu40; _cars_web_key=SFMyNTY.g3QAAAANbQAAAAxDQVJTX3RyaXBfaWRtAAAAJGUzNGI4MzI5LTJkYmItNGQ1Ni05MTlkLWIxODUzZDFmMmQ1ZG0AAAALX2NzcmZfdG9rZW5tAAAAGDlfNERjNzhJYlB0Rk05NlMtYkc1Nl9UQm0AAAAQYWxzX3ByaXZhdGVfZGF0YW0AAAC1UVRFeU9FZERUUS5DcVF6ay1GZ3NrNFgwVmJ5eEhVZ3FHbm43ZGRyYzFyaTVucjlQaGV6cXhvY1FIeWFLcDNWQzJUS05Zcy5XWnlpMjVZVkhlM2w3TUFlLjlIc3RzX3hqRWY5RmNaVDk3RTRWalBSbGhzRzdOclZsUGxvNTRVei1nYjU3YkJFMktac2NEV0ZON3lVQ0lwZDJ2Rm5POFEubU9DYkw3bzdndVR0X0syWmNZR2hKd20AAAARZmFjZWJvb2tfZXZlbnRfaWRtAAAAVGRISnBjRjlwWkQxbE16UmlPRE15T1MweVpHSmlMVFJrTlRZdE9URTVaQzFpTVRnMU0yUXhaakprTldRbWRITTlNVFk1TmpZNU1EWXhPVEkyTWc9PW0AAAAYZmFjZWJvb2tfZXZlbnRfaW50ZW50X2lkZAADbmlsbQAAAA9ncmFwaHFsX2FwaV9rZXltAAAAIDVycm1uV1ZsMU1EelBjRW5EdkVwM1B1MTAxSUdYRUdvbQAAAA1pc19zZWFyY2hfYm90ZAAFZmFsc2VtAAAAEGxhc3Rfdmlld2VkX3BhZ2VtAAAAES9kZWFsZXJzL3Jldmlld3MvbQAAAA9sb2NhbGVfbWFwcGluZ3N0AAAAAW0AAAANMTc4LjIzMy43Ni41MHQAAAAIZAAKX19zdHJ1Y3RfX2QAFUVsaXhpci5DYXJzV2ViLkxvY2FsZWQAD2NpdHlfc3RhdGVfc2x1Z20AAAAJYWxiYW55LW55ZAAaZGVzaWduYXRlZF9tYXJrZXRfYXJlYV9rZXltAAAACmFsYmFueXRyb3lkAAhsYXRpdHVkZUZARVZUYKpkw2QACmxvY2FsX3pvbmVtAAAAB3Vuem9uZWRkAAlsb25naXR1ZGVGwFJyFPi1iONkAAttYXJrZXRfbmFtZW0AAAAGYWxiYW55ZAAIemlwX2NvZGVtAAAABTEyMjA2bQAAAA5zZWFyY2hfemlwY29kZW0AAAAFMTIyMDZtAAAAEHRvdGFsX3BhZ2Vfdmlld3NhCm0AAAANd2ViX3BhZ2VfdHlwZW0AAAAWZGVhbGVycy9kZWFsZXItZGV0YWlsc20AAAASd2ViX3BhZ2VfdHlwZV9mcm9tbQAAAAhob21lcGFnZQ.nvHHdC7NacptxfF_c5V0T7dzpLgEo_6nslJ8p9qXaak; bm_sv=2C280EFBF8D926AE462A76F83DEA5AA6~YAAQvoYUAnuAMPiKAQAALEWkChXCp4+yh3LfI5kwGkGnfhDrKiijJJ9bOk6zRqaCrcqrHrIJUvfQI1K974MTvwv1NkQ2spiVem5G4H4R2uEs29ogepo5i9Bu0G7v0AFVsKFnOlgjaawa03fpC1b8qzc+vgPIbnWRXGsXnOdJXek65hNHysf+sFyNguZtryXgHO1zjTwGPsX11PowBZXeYqR0NKltEJDG9OIwgnEo8v5YJ2gaPSVakD7ZpaZ+U+8=~1; _ga=GA1.1.1704964458.1696688897; _uetsid=bf8b9a60651d11ee8a3211461756d986; _uetvid=bf8baa30651d11ee8cbea3e331cc35c4; _tq_id.TV-09274518-1.6c07=8508f3f072268ee7.1696688900.0.1696690620..; QSI_HistorySession=https%3A%2F%2Fwww.cars.com%2Fvehicledetail%2F2c4e260f-99b7-45c9-9717-abf38d63d7ff%2F~1696689479141%7Chttps%3A%2F%2Fwww.cars.com%2Fdealers%2F187317%2Fdestination-kia%2F%23Reviews~1696690593284%7Chttps%3A%2F%2Fwww.cars.com%2Fdealers%2F~1696690600438%7Chttps%3A%2F%2Fwww.cars.com%2Fdealers%2F187317%2Fdestination-kia%2F%23Reviews~1696690602829%7Chttps%3A%2F%2Fwww.cars.com%2F~1696690619648%7Chttps%3A%2F%2Fwww.cars.com%2Fdealers%2Freviews%2F~1696690620770; smtrrmkr=638322874255987464%5E018b0a8a-05ee-442f-9f6a-bc1ad33a3e3d%5E018b0a8a-05ee-4010-a77c-adff1d21cba3%5E0%5E178.233.76.50; s_lv=1696690624430; s_tslv=1696690624430; _ga_LGBH9NL64W=GS1.1.1696688896.1.1.1696690635.26.0.0; _ga_0SVYF8BFF1=GS1.1.1696688896.1.1.1696690635.0.0.0; s_tp=30139; s_ppv=shopping%2Fsearch-results%2C2%2C2%2C746; _dd_s=rum=0&expire=1696691555863; _abck=9A88A1203CBFC2CDB9A90DBBF2618196~-1~YAAQvoYUAiwGMfiKAQAAx/iyCgqXgdhAPbTq7XBz+Lweg9RSrJhXChjuRXZGRgNNJsY638C05NP9ELq0sIMXCMLTNgTPQZVDbCYgrequQJ57laxyskFaX+b2NwIblzAZabi8v3BgpB/TUKrV0txsCBOdIKxf+UEo5DHIUxTgjs+8/TaaG7P4KyXOjaZALxno43VHnO0nvtaYFMDd3mU64t1SdbJ/6PW3lRkXSfP56mp61lItC6CJQ45lk5Q2KFubAhxQ/a1bssQNOzWYvpmre3QzkTo55m0LXjUDGfEmEAnGlz1MrUN8EIa52T5GDENP7NZAicLxOA663F+teiFEhReOGozRtU2381Oz6YSXsB8WExA1dfdjhU7FMfwFDKtKqesZ+tbVH5GMIHyRBNvO3w3YSEmGxPQ=~0~-1~-1; ak_bmsc=E7F0BE88D5FC808A0E9BAAD044830816~000000000000000000000000000000~YAAQvoYUAi0GMfiKAQAAx/iyChU6Iu7n0LhYYHyUVvuZH/yD3s4lo0jqiWveTRhf6mB6GwulAdkuVwrpuyU5altoapZENi3jRRZtHAJspUG/LQAJCf6RI6toDsNti2u7Nm24vonQGqZ5DRu77ItWGsN6TWp538kct6CkFGt2Dwcq4V0hKo501KeM56tFUMEYvNeNWs//iUo52rIPpGHbz1KfLVTBPA65SwvHyrTWlUnCxZoIktRVbB2N8Kl5Gj8yFkwWRVNRXEIg+uoQUZG34O5LWLxMV5QUc6ZHzONlwKpNGtEcAV8hzc5vJoWSQqJTG1hvmxQiaUrj8wKsF4gWrQpyo+ybCX7+jJFQzwkfNcIrkZDl4pdTFC8IQKVu0bkFoiKJKW/gV+2KMOpChd6Br8HGUgwemIg3rzwuGZkcf9IOCaG4X8tnKzPtP2ISIW8c2/Wye+Dm0jJ9A0PAqX4cKtxgE65FMvBDKiqvNOejDC35gSODv3RP/uXObmYm2ixnHdgIbzvTe93/8U83Iuo7YP2E9Wk=; bm_mi=4DB48FCEA082564929365C96D90117DC~YAAQvoYUAl0BMfiKAQAA1WmyChWRt6VneA24WKBATqTcgeR1c+MjhcRB/PM4S5SRsRsRHUFZaOf+avOgYoQQSjvveCQAiWkr+Vybb8iSWO8jOyHjAZWa8jg/W813XBASRYgcwWfvbtzwXescWAT4uG2zCy6EWVmZ8f6tny/NpzqGn35VPmnRBrVPLwUPr+VG6NVoGr9avKZr1ZSlS7np9GpG5WktvVbc1dfpI8LG3bN5/ej6Scz4yLfLnriGS231JwId9TX9ZoRZUWU2J/TkCxC1LwtbG2P42qIH44/C75ZdX++MveGFIDJZO6jVR9FdzsCgPklFsbZsA1E=~1; bm_sv=2C280EFBF8D926AE462A76F83DEA5AA6~YAAQvoYUAi4GMfiKAQAAx/iyChU8DMxbL4kPIeroqvx9c1HkhIhOGbQ9q0CFOO2JWbt4gl9MknpZSkQHgyt5CkAItLu+6SoJJJNX38US2dxedDzjEFCPmtoUlG34UZ6T/YSkUL02/NifWUo2KhFwq+AP4I02GZhztgUJ/KdnazYofBXW55PDnmYhAHetRNelepWF0tlc3A/SIYbvtxezuoLiueQADTbLMHhhnePZJKYkNsbrG66kyKTmHIIqtoI=~1; bm_sz=36F39175F590614E19CD893EB952708F~YAAQvoYUAoYAMfiKAQAAOD6yChWucbcHGhchyHemC0EWM1YY/DhpMFArXtuxvWuX5glXKeZr4X9PM4tsbVEC8c97FhN/TgfUCOBTiXqiddTTew3Sipn0/bCR1BlurOUgmyRrqlmzwf2uERhEJMVtrr63/10F30D8mh2B2V8vMFPaXla7dxT8nM2yms7mD7MIexy82aBxwP93kxX2C74vIYBhECOJYuo/w/wdx0VhYta6on7uMhGC7rDHO0+OzNCwKLm+lnqfUs7I5f2TiE302GGbWhXCtfHC/z5MZAIk9NZm~4342835~3683894; CARS_logged_in=false; CARS_marketing_source=SFMyNTY.g2gDdAAAAARkAApfX3N0cnVjdF9fZAAjRWxpeGlyLkNhcnNXZWIuUGx1Zy5NYXJrZXRpbmdTb3VyY2VkAAhhZmZfY29kZW0AAAAGc2VvYWZmZAAMY2xpY2tfc291cmNldAAAAABkAAN1dG10AAAAC2QACl9fc3RydWN0X19kACVFbGl4aXIuQ2Fyc1dlYi5TaXRlQWN0aXZpdHkuVVRNUGFyYW1zZAAMdXRtX2NhbXBhaWduZAADbmlsZAAPdXRtX2NhbXBhaWduX2lkZAADbmlsZAALdXRtX2NvbnRlbnRkAANuaWxkABV1dG1fZmlyc3Rfc2Vzc2lvbl9oaXRkAAVmYWxzZWQACnV0bV9tZWRpdW1kAANuaWxkAAx1dG1fbW9kaWZpZWRkAAR0cnVlZAAOdXRtX3NldF9tZXRob2RtAAAAC3JlZmVyZXJfdXJsZAAKdXRtX3NvdXJjZWQAA25pbGQACHV0bV90ZXJtZAADbmlsZAALdXRtX3RydXN0ZWRkAAR0cnVlbgYASfCyCosBYgABUYA.LfRqyl6qj4-emTLjTdmMZw6hsATpoh8pq1fMG8Cra34; CARS_trip_id=e34b8329-2dbb-4d56-919d-b1853d1f2d5d; _cars_web_key=SFMyNTY.g3QAAAANbQAAAAxDQVJTX3RyaXBfaWRtAAAAJGUzNGI4MzI5LTJkYmItNGQ1Ni05MTlkLWIxODUzZDFmMmQ1ZG0AAAALX2NzcmZfdG9rZW5tAAAAGDlfNERjNzhJYlB0Rk05NlMtYkc1Nl9UQm0AAAAQYWxzX3ByaXZhdGVfZGF0YW0AAAC1UVRFeU9FZERUUS5DcVF6ay1GZ3NrNFgwVmJ5eEhVZ3FHbm43ZGRyYzFyaTVucjlQaGV6cXhvY1FIeWFLcDNWQzJUS05Zcy5XWnlpMjVZVkhlM2w3TUFlLjlIc3RzX3hqRWY5RmNaVDk3RTRWalBSbGhzRzdOclZsUGxvNTRVei1nYjU3YkJFMktac2NEV0ZON3lVQ0lwZDJ2Rm5POFEubU9DYkw3bzdndVR0X0syWmNZR2hKd20AAAARZmFjZWJvb2tfZXZlbnRfaWRtAAAAVGRISnBjRjlwWkQxbE16UmlPRE15T1MweVpHSmlMVFJrTlRZdE9URTVaQzFpTVRnMU0yUXhaakprTldRbWRITTlNVFk1TmpZNU1UVTRNVEF3TVE9PW0AAAAYZmFjZWJvb2tfZXZlbnRfaW50ZW50X2lkZAADbmlsbQAAAA9ncmFwaHFsX2FwaV9rZXltAAAAIDVycm1uV1ZsMU1EelBjRW5EdkVwM1B1MTAxSUdYRUdvbQAAAA1pc19zZWFyY2hfYm90ZAAFZmFsc2VtAAAAEGxhc3Rfdmlld2VkX3BhZ2VtAAAAEi9zaG9wcGluZy9yZXN1bHRzL20AAAAPbG9jYWxlX21hcHBpbmdzdAAAAAFtAAAADTE3OC4yMzMuNzYuNTB0AAAACGQACl9fc3RydWN0X19kABVFbGl4aXIuQ2Fyc1dlYi5Mb2NhbGVkAA9jaXR5X3N0YXRlX3NsdWdtAAAACWFsYmFueS1ueWQAGmRlc2lnbmF0ZWRfbWFya2V0X2FyZWFfa2V5bQAAAAphbGJhbnl0cm95ZAAIbGF0aXR1ZGVGQEVWVGCqZMNkAApsb2NhbF96b25lbQAAAAd1bnpvbmVkZAAJbG9uZ2l0dWRlRsBSchT4tYjjZAALbWFya2V0X25hbWVtAAAABmFsYmFueWQACHppcF9jb2RlbQAAAAUxMjIwNm0AAAAOc2VhcmNoX3ppcGNvZGVtAAAABTEyMjA2bQAAABB0b3RhbF9wYWdlX3ZpZXdzYQttAAAADXdlYl9wYWdlX3R5cGVtAAAAF3Nob3BwaW5nL3NlYXJjaC1yZXN1bHRzbQAAABJ3ZWJfcGFnZV90eXBlX2Zyb21tAAAAFmRlYWxlcnMvZGVhbGVyLWRldGFpbHM.q35LEd4bukElSMyhnvFvEA0rws7y8dKVWxpcXHiR6Gs',
-  'sec-ch-ua': '"Chromium";v="116", "Not)A;Brand";v="24", "Opera GX";v="102"',
-  'sec-ch-ua-mobile': '?0',
-  'sec-ch-ua-platform': '"Windows"',
-  'sec-fetch-dest': 'document',
-  'sec-fetch-mode': 'navigate',
-  'sec-fetch-site': 'same-origin',
-  'sec-fetch-user': '?1',
-  'upgrade-insecure-requests': '1',
-  'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/116.0.0.0 Safari/537.36 OPR/102.0.0.0'
-}
-
-
-# Scraper örneğini oluştur ve çalıştır
-scraper = CarsScraper(headers)
-scraper.run()
+    def archive_snapshot(self):
+        """Mevcut çıktıyı önceki anlık görüntü olarak kenara taşır (dealers.csv -> dealers.prev.csv)."""
+        if not os.path.exists(self.output_path):
+            return None
+        base, ext = os.path.splitext(self.output_path.rstrip('/'))
+        previous = f"{base}.prev{ext}"
+        if os.path.isdir(previous):
+            shutil.rmtree(previous)
+        elif os.path.exists(previous):
+            os.remove(previous)
+        shutil.move(self.output_path, previous)
+        return previous
+
+    def run(self, engine="thread", resume=True, refresh=False, previous_snapshot=None):
+        """Scraper'ı çalıştırır. engine: 'thread' (ThreadPoolExecutor) veya 'async' (asyncio + aiohttp).
+
+        resume=False frontier'ı sıfırlayıp taramaya baştan başlar. refresh=True artımlı bir
+        yenileme taraması başlatır: bayiler koşullu isteklerle (ve `dealer_ttl` içinde hiç
+        istenmeden) yeniden kontrol edilir, çıktı yeni bir anlık görüntü olarak yazılır ve
+        tarama bittiğinde önceki görüntüye (`previous_snapshot`, varsayılan olarak önceki çıktı)
+        göre yeni/değişen/kaybolan bayiler `delta_path`'e yazılır. Yarıda kalmış bir yenileme
+        taraması varken refresh=True aynı taramaya devam eder. `max_dealer_attempts` çalışmada
+        istenemeyen ya da ayrıştırılamayan bayiler önceki sonuçlarıyla yeni görüntüye taşınır.
+        """
+        if engine not in ("thread", "async"):
+            raise ValueError(f"Unknown engine: {engine!r} (expected 'thread' or 'async')")
+
+        self.frontier = Frontier(self.frontier_path)
+        try:
+            if not resume:
+                self.frontier.reset()
+            if refresh and self.frontier.get_meta('previous_snapshot') is None:
+                # Boş değer, karşılaştırılacak önceki çıktı olmayan bir yenileme taramasını işaretler
+                self.frontier.set_meta('previous_snapshot', previous_snapshot or self.archive_snapshot() or '')
+                self.frontier.start_refresh()
+                append = False
+            else:
+                # Devam edilen bir çalışmada (yarıda kalmış bir yenileme taraması dahil; yeniden
+                # arşivlenmez) önceki satırlar korunur, yeni satırlar sona eklenir
+                append = resume and not self.frontier.is_empty()
+            self.frontier.add_zips(self.zip_codes)
+
+            self.writer = RowWriter(self.output_path, append=append, on_flush=self.frontier.complete_dealers)
+            self.metrics = self.fetcher.metrics = Metrics()
+            self.changed_dealers = set()
+            self.metrics.set_level('zips', len(self.frontier.pending_zips()))
+            self.metrics.add_gauge('writer', self.writer.queue.qsize)
+            if self.progress_interval:
+                self.metrics.start_progress(self.progress_interval)
+            try:
+                if engine == "thread":
+                    self.run_threaded()
+                else:
+                    asyncio.run(self.run_async())
+            finally:
+                self.writer.close()
+                self.metrics.stop_progress()
+                self.summary = self.metrics.write_summary(self.metrics_path,
+                                                          sys.stdout if self.print_summary else None,
+                                                          rows_written=self.writer.rows_written,
+                                                          dealers_changed=len(self.changed_dealers))
+
+            self.save_customer_ids(self.frontier.customer_ids())
+
+            # Yenileme taraması (yarıda kalıp devam ettirilmiş olsa bile) tamamlandıysa farkı yaz
+            previous = self.frontier.get_meta('previous_snapshot')
+            if previous is not None:
+                pending_zips, pending_dealers = self.frontier.pending_counts()
+                if pending_zips or pending_dealers:
+                    print(f"Refresh pass incomplete: {pending_zips} ZIP(s) and {pending_dealers} dealer(s) pending. "
+                          f"The delta is deferred until a later run with refresh=True finishes the pass.")
+                else:
+                    if previous:
+                        compute_delta(previous, self.output_path, self.delta_path)
+                    self.frontier.set_meta('previous_snapshot', None)
+        finally:
+            self.frontier.close()
+
+    def dispatch_dealer(self, customer_id):
+        # Bekleyen bayi isteklerinin sayısı ilerleme satırında kuyruk derinliği olarak görünür
+        self.metrics.adjust('dealers', 1)
+        self.submit_dealer(customer_id)
+
+    def submit_logged(self, executor, function, item):
+        """İşi havuza gönderir; işin hatası sessizce kaybolmasın diye tamamlanınca yazdırılır."""
+        def report(future):
+            # Kesintiden sonra kapanan havuzlara gönderilemeyen işlerin hataları beklenen sonuçtur
+            if not self.interrupted and not future.cancelled() and future.exception() is not None:
+                print(f"Unexpected error while processing {item}: {future.exception()!r}")
+
+        future = executor.submit(function, item)
+        future.add_done_callback(report)
+        return future
+
+    def run_threaded(self):
+        with ThreadPoolExecutor(max_workers=self.concurrency) as zip_executor, \
+                ThreadPoolExecutor(max_workers=self.concurrency) as page_executor, \
+                ThreadPoolExecutor(max_workers=self.concurrency) as dealer_executor:
+            self.interrupted = False
+            try:
+                # Bir ZIP'in 2. ve sonraki sayfaları bu havuzda eşzamanlı istenir
+                self.page_executor = page_executor
+                # Bayi sayfaları, ID'ler keşfedildiği anda ZIP taramasıyla eş zamanlı istenir
+                self.submit_dealer = lambda cid: self.submit_logged(dealer_executor, self.request_dealer_page, cid)
+                for cid in self.frontier.pending_customer_ids():
+                    self.dispatch_dealer(cid)
+
+                self.log('Starting to process zip codes...')  # ZIP kodları işlenmeye başlanıyor
+                # Paralel olarak bekleyen her ZIP kodu için get_customer_ids metodunu çalıştır
+                wait([self.submit_logged(zip_executor, self.process_zip_code, zip_code)
+                      for zip_code in self.frontier.pending_zips()])
+                self.log('Waiting for remaining dealer pages...')
+            except BaseException:
+                # Kesintide (Ctrl+C) kuyruktaki işler iptal edilir; yalnızca süren istekler beklenir
+                self.interrupted = True
+                for executor in (zip_executor, page_executor, dealer_executor):
+                    executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    async def run_async(self):
+        loop = asyncio.get_running_loop()
+        loop_thread = threading.get_ident()
+        zip_queue = asyncio.Queue()
+        dealer_queue = asyncio.Queue()
+        for zip_code in self.frontier.pending_zips():
+            zip_queue.put_nowait(zip_code)
+
+        def submit_dealer(customer_id):
+            # ID'ler çoğunlukla to_thread içinde keşfedilir; kuyruğa olay döngüsü üzerinden eklenir.
+            # Döngünün kendi içinden hemen eklenir, yoksa join() henüz eklenmemiş işi beklemeden döner.
+            if threading.get_ident() == loop_thread:
+                dealer_queue.put_nowait(customer_id)
+            else:
+                loop.call_soon_threadsafe(dealer_queue.put_nowait, customer_id)
+
+        self.submit_dealer = submit_dealer
+
+        async def worker(queue, handle):
+            # Her aşamada yalnızca `concurrency` görev vardır; iş öğeleri kuyrukta bekler
+            while True:
+                item = await queue.get()
+                try:
+                    await handle(item)
+                except Exception as e:
+                    print(f"Unexpected error while processing {item}: {e!r}")
+                finally:
+                    queue.task_done()
+
+        # Tek havuz: en fazla `concurrency` adet keep-alive bağlantı, her iki aşama için ortak
+        async with self.fetcher.async_session() as session:
+            workers = [asyncio.create_task(worker(zip_queue, lambda z: self.get_customer_ids_async(session, z)))
+                       for _ in range(self.concurrency)]
+            workers += [asyncio.create_task(worker(dealer_queue, lambda c: self.request_dealer_page_async(session, c)))
+                        for _ in range(self.concurrency)]
+            for cid in self.frontier.pending_customer_ids():
+                self.dispatch_dealer(cid)
+
+            try:
+                self.log('Starting to process zip codes...')
+                await zip_queue.join()
+                self.log('Waiting for remaining dealer pages...')
+                await dealer_queue.join()
+            finally:
+                # Kesintide de oturum kapanmadan önce tüm işçiler iptal edilip beklenir
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+
+if __name__ == "__main__":
+    # Scraper örneğini oluştur ve çalıştır
+    scraper = CarsScraper(headers)
+    scraper.run()
+    scraper.save_to_excel()
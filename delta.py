@@ -0,0 +1,75 @@
+import argparse
+import csv
+import hashlib
+import json
+import re
+
+from row_writer import BASE_COLUMNS, iter_rows
+
+DEALER_ID_RE = re.compile(r'/dealers/(\d+)')
+
+
+def dealer_key(row):
+    """Bayiyi anlık görüntüler arasında eşleştiren anahtar: URL'deki bayi ID'si (yoksa URL)."""
+    url = row.get('URL') or ''
+    match = DEALER_ID_RE.search(url)
+    return match.group(1) if match else url
+
+
+def dealer_hash(row):
+    """Çıkarılan bayi alanlarının içerik özeti; URL ve boş alanlar hariç tutulur."""
+    fields = {k: str(v).strip() for k, v in row.items() if k != 'URL' and v is not None and str(v).strip()}
+    return hashlib.sha1(json.dumps(fields, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def compute_delta(previous_path, current_path, out_path):
+    """İki anlık görüntüyü karşılaştırıp yeni, değişen ve kaybolan bayileri CSV'ye yazar.
+
+    Yalnızca önceki görüntünün anahtar/özet eşlemesi bellekte tutulur; iki dosya da akışla okunur.
+    """
+    previous = {dealer_key(row): dealer_hash(row) for row in iter_rows(previous_path)}
+
+    changes = []
+    seen = set()
+    for row in iter_rows(current_path):
+        key = dealer_key(row)
+        seen.add(key)
+        if key not in previous:
+            changes.append(('new', row))
+        elif previous[key] != dealer_hash(row):
+            changes.append(('changed', row))
+
+    vanished = set(previous) - seen
+    for row in iter_rows(previous_path):
+        key = dealer_key(row)
+        if key in vanished:
+            changes.append(('vanished', row))
+            vanished.discard(key)
+
+    columns = ['change'] + list(BASE_COLUMNS)
+    for _, row in changes:
+        columns.extend(key for key in row if key not in columns)
+
+    with open(out_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, restval='')
+        writer.writeheader()
+        for change, row in changes:
+            writer.writerow({'change': change, **row})
+
+    counts = {kind: sum(1 for change, _ in changes if change == kind) for kind in ('new', 'changed', 'vanished')}
+    print(f"Delta written to {out_path}: {counts['new']} new, {counts['changed']} changed, "
+          f"{counts['vanished']} vanished.")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two dealer snapshots (csv, jsonl, parquet or xlsx).")
+    parser.add_argument('previous')
+    parser.add_argument('current')
+    parser.add_argument('--out', default='dealers_delta.csv')
+    args = parser.parse_args()
+    compute_delta(args.previous, args.current, args.out)
+
+
+if __name__ == "__main__":
+    main()
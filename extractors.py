@@ -0,0 +1,168 @@
+import json
+import re
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+
+
+class SoupExtractor:
+    """Sayfanın tamamından BeautifulSoup ağacı kuran referans çıkarıcı."""
+
+    def parse(self, content):
+        return BeautifulSoup(content, 'html.parser')
+
+    def search_page(self, content, with_total=False):
+        """Arama sayfasından ilan href'lerini ve müşteri ID'lerini çıkarır.
+
+        with_total=True ise toplam ilan sayısı da aynı ağaçtan okunup üçüncü değer olarak döner.
+        """
+        soup = self.parse(content)
+
+        # Sayfadaki href özelliklerini topla
+        hrefs = set(a['href'] for a in soup.find_all('a', class_='vehicle-card-link js-gallery-click-link', href=True))
+
+        # Müşteri ID'lerini topla
+        customer_ids = set()
+        a = soup.find("cars-datalayer", attrs={"store": "als"})
+        if a:
+            data = json.loads(a.text)
+            for entry in data:
+                for vehicle in entry['vehicle_array']:
+                    customer_ids.add(vehicle['customer_id'])
+        if with_total:
+            return hrefs, customer_ids, self.total_count(soup)
+        return hrefs, customer_ids
+
+    def result_count(self, content):
+        """Arama sayfasındaki toplam ilan sayısını döndürür; bulunamazsa None."""
+        return self.total_count(self.parse(content))
+
+    def total_count(self, soup):
+        tag = soup.find('span', class_='total-filter-count')
+        digits = tag and re.sub(r'\D', '', tag.text)
+        return int(digits) if digits else None
+
+    def dealer_page(self, content, url):
+        """Bayi sayfasından bayi bilgilerini çıkarır; bayi adı yoksa None döndürür."""
+        soup = self.parse(content)
+
+        dealer_name = (found := soup.find('h1', class_='sds-heading--1 dealer-heading')) and found.text.strip()
+
+        if not dealer_name:
+            return None
+
+        # dealer_website'i çekme
+        dealer_website_tag = soup.find('a', {'data-connection-intent-id': 'dealer-profile-page-website-transfer'})
+        dealer_website = dealer_website_tag['href'] if dealer_website_tag else None
+
+        # dealer_address ve dealer_direction_link'i çekme
+        direction_tag = soup.find('a', {'data-connection-intent-id': 'dealer-directions-connection'})
+        dealer_direction_link = direction_tag['href'] if direction_tag else None
+        dealer_address = direction_tag['aria-label'] if direction_tag else None
+
+        # Telefon numaralarını çekme
+        result = {
+                "dealer_name": dealer_name,
+                "dealer_website": dealer_website,
+                "dealer_direction_link": dealer_direction_link,
+                "dealer_address": dealer_address,
+                "URL": url.strip()
+                }
+
+        phones = soup.find_all("div", class_="dealer-phone")
+
+        for phone in phones:
+            title = phone.find("span", class_="phone-number-title").text.strip()
+            # Eğer title boşsa "Used" olarak değiştir
+            if not title:
+                title = "Used"
+            number = phone.find("a", class_="phone-number").text.strip()
+            result[title] = number
+
+        return result
+
+    def city_links(self, content, base_url='https://www.cars.com'):
+        """Şehir site haritasından şehir sayfalarının mutlak URL'lerini sırasıyla döndürür."""
+        soup = self.parse(content)
+        links = [urljoin(base_url, a['href']) for a in soup.find_all('a', attrs={"data-linkname": "shopping-city"}, href=True)]
+        return list(dict.fromkeys(links))
+
+    def city_zip(self, content):
+        """Şehir sayfasındaki arama formunun ZIP değerini döndürür; bulunamazsa None."""
+        soup = self.parse(content)
+        tag = soup.find('input', id='zip-input')
+        value = tag and (tag.get('value') or '').strip()
+        return value or None
+
+
+# Tırnak içindeki '>' karakterlerini atlayarak tek bir açılış etiketini yakalar
+_ATTRS = r'''(?:[^>"']|"[^"]*"|'[^']*')*'''
+CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+DATALAYER_RE = re.compile(r'<cars-datalayer\b' + _ATTRS + r'>.*?</cars-datalayer>', re.I | re.S)
+A_TAG_RE = re.compile(r'<a\s' + _ATTRS + r'>', re.I)
+SPAN_RE = re.compile(r'<span\b' + _ATTRS + r'>.*?</span>', re.I | re.S)
+H1_RE = re.compile(r'<h1\b' + _ATTRS + r'>.*?</h1>', re.I | re.S)
+DIV_TAG_RE = re.compile(r'<div\b' + _ATTRS + r'>', re.I)
+INPUT_TAG_RE = re.compile(r'<input\b' + _ATTRS + r'>', re.I)
+A_CLOSE_RE = re.compile(r'</a\s*>', re.I)
+PHONE_NUMBER_CLASS_RE = re.compile(r'''class\s*=\s*["']?[^"'>]*(?<![\w-])phone-number(?![\w-])''', re.I)
+
+
+class FastExtractor(SoupExtractor):
+    """Yalnızca gereken parçaları düzenli ifadelerle kesip küçük bir ağaçta ayrıştıran çıkarıcı.
+
+    Parçalar SoupExtractor'ın aynı sorgularıyla işlendiği için çıktı aynıdır; tüm sayfa
+    yerine birkaç kilobaytlık bir belge ayrıştırılır.
+    """
+
+    def decode(self, content):
+        if isinstance(content, str):
+            return content
+        match = CHARSET_RE.search(content, 0, 4096)
+        encoding = match.group(1).decode('ascii') if match else 'utf-8'
+        try:
+            return content.decode(encoding, errors='replace')
+        except LookupError:
+            return content.decode('utf-8', errors='replace')
+
+    def search_page(self, content, with_total=False):
+        text = self.decode(content)
+        fragments = DATALAYER_RE.findall(text)
+        fragments += [tag + '</a>' for tag in A_TAG_RE.findall(text) if 'vehicle-card-link' in tag]
+        if with_total:
+            fragments += [span for span in SPAN_RE.findall(text) if 'total-filter-count' in span]
+        return super().search_page(''.join(fragments), with_total)
+
+    def result_count(self, content):
+        text = self.decode(content)
+        return super().result_count(''.join(span for span in SPAN_RE.findall(text) if 'total-filter-count' in span))
+
+    def phone_blocks(self, text):
+        # dealer-phone div'inin başından içindeki ilk phone-number bağlantısının kapanışına kadar
+        for div in DIV_TAG_RE.finditer(text):
+            if 'dealer-phone' not in div.group():
+                continue
+            for link in A_TAG_RE.finditer(text, div.end()):
+                if PHONE_NUMBER_CLASS_RE.search(link.group()):
+                    close = A_CLOSE_RE.search(text, link.end())
+                    if close:
+                        yield text[div.start():close.end()] + '</div>'
+                    break
+
+    def dealer_page(self, content, url):
+        text = self.decode(content)
+        fragments = [h1 for h1 in H1_RE.findall(text) if 'dealer-heading' in h1]
+        fragments += [tag + '</a>' for tag in A_TAG_RE.findall(text) if 'data-connection-intent-id' in tag]
+        fragments += self.phone_blocks(text)
+        return super().dealer_page(''.join(fragments), url)
+
+    def city_links(self, content, base_url='https://www.cars.com'):
+        text = self.decode(content)
+        fragments = [tag + '</a>' for tag in A_TAG_RE.findall(text) if 'shopping-city' in tag]
+        return super().city_links(''.join(fragments), base_url)
+
+    def city_zip(self, content):
+        text = self.decode(content)
+        return super().city_zip(''.join(tag for tag in INPUT_TAG_RE.findall(text) if 'zip-input' in tag))
+
+
+EXTRACTORS = {'soup': SoupExtractor, 'fast': FastExtractor}
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+from collections import namedtuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import Metrics
+
+# Async isteklerin döndürdüğü yanıt; requests.Response ile aynı alan adlarını kullanır
+FetchedPage = namedtuple('FetchedPage', ['url', 'status_code', 'headers', 'content'])
+
+
+class Fetcher:
+    """Tüm tarayıcıların ortak, yeniden denemeli GET döngüsü (requests ve aiohttp).
+
+    Her deneme aynı anda en fazla `concurrency` istekle ve host'un hız sınırı içinde yapılır.
+    Bağlantı hataları ve 429/403/5xx yanıtları yeniden denenir; diğer 4xx yanıtları ve
+    denemeleri tükenen istekler başarısız sayılıp None döndürür. 304 başarılı bir yanıttır.
+    İstekler `metrics`'e aşama bazında kaydedilir; `network` verilirse bağlantı yokken beklenir.
+    """
+
+    def __init__(self, rate_limiter, metrics=None, network=None, concurrency=8, headers=None, timeout=10,
+                 max_retries=3, retry_delay=5, log=None):
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics or Metrics()
+        self.network = network
+        self.concurrency = concurrency
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.log = log or (lambda message: None)
+        self.session = self.create_session()
+        # Thread sayısından bağımsız olarak aynı anda en fazla `concurrency` istek
+        self.request_slots = threading.BoundedSemaphore(concurrency)
+        self.semaphore = None
+
+    def create_session(self):
+        """Keep-alive bağlantılarını tüm thread'ler arasında paylaşan havuzlu oturum."""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.concurrency)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def async_session(self):
+        """Async istekler için havuzlu aiohttp oturumu; çalışan olay döngüsü içinde açılmalıdır."""
+        # aiohttp yalnızca async istekler için gerekli; yalnızca senkron kullananlar onu yüklemez
+        try:
+            import aiohttp
+        except ImportError:
+            raise RuntimeError("Async requests require aiohttp (pip install aiohttp).")
+        # Tek havuz: en fazla `concurrency` adet keep-alive bağlantı
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=30, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        return aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout)
+
+    def wait_for_network(self):
+        # Ağ devresi açıksa (bağlantı yok) yoklama zamanına kadar bekle
+        while self.network and (wait := self.network.check()):
+            time.sleep(wait)
+
+    def retry_after_error(self, error, attempt, limiter, phase, url):
+        """Yanıt alınamayan denemeyi kaydeder; yeniden denenecekse beklenecek saniyeyi, yoksa None döndürür."""
+        self.metrics.record_error(phase)
+        if attempt < self.max_retries - 1:
+            self.metrics.record_retry(phase)
+            delay = limiter.backoff(attempt, self.retry_delay)
+            self.log(f"Error occurred: {error!r}. Retrying {url} in {delay:.1f} seconds...")
+            return delay
+        self.metrics.record_failure(phase)
+        print(f"Error occurred: {error!r}. No more retries left for {url}")
+        return None
+
+    def check_response(self, response, attempt, limiter, phase, url):
+        """Yanıtı değerlendirir: 'ok', 'retry' ya da 'failed'."""
+        # 429/403/5xx: hız düşürülür ve host Retry-After kadar bekletilir
+        if limiter.record(response.status_code, response.headers.get('Retry-After')):
+            if attempt < self.max_retries - 1:
+                self.metrics.record_retry(phase, throttled=True)
+                self.log(f"Throttled with HTTP {response.status_code} on {url}. Backing off...")
+                return 'retry'
+            self.metrics.record_failure(phase, throttled=True)
+            print(f"Throttled with HTTP {response.status_code}. No more retries left for {url}")
+            return 'failed'
+        if response.status_code >= 400:
+            self.metrics.record_failure(phase)
+            print(f"HTTP {response.status_code} for {url}")
+            return 'failed'
+        return 'ok'
+
+    def fetch(self, url, headers=None, params=None, phase='other'):
+        """URL'yi ister ve başarılı yanıtı döndürür; başarısızsa None."""
+        limiter = self.rate_limiter.for_url(url)
+        for attempt in range(self.max_retries):
+            self.wait_for_network()
+            try:
+                with self.request_slots:
+                    # Hız sınırı slot alındıktan sonra beklenir: en fazla `concurrency` bekleyen olur
+                    limiter.acquire()
+                    start = time.perf_counter()
+                    response = self.session.get(url, headers=headers, params=params, timeout=self.timeout)
+                    self.metrics.record_request(phase, time.perf_counter() - start, response.status_code,
+                                                len(response.content))
+            except requests.RequestException as e:
+                if self.network and isinstance(e, requests.ConnectionError):
+                    self.network.record_failure()
+                delay = self.retry_after_error(e, attempt, limiter, phase, url)
+                if delay is None:
+                    return None
+                time.sleep(delay)
+                continue
+
+            if self.network:
+                self.network.record_success()
+            outcome = self.check_response(response, attempt, limiter, phase, url)
+            if outcome != 'retry':
+                return response if outcome == 'ok' else None
+        return None
+
+    async def fetch_async(self, session, url, headers=None, params=None, phase='other'):
+        """fetch'in asyncio karşılığı; `async_session` ile açılan oturumu kullanır ve FetchedPage döndürür."""
+        import aiohttp
+
+        limiter = self.rate_limiter.for_url(url)
+        for attempt in range(self.max_retries):
+            if self.network and not self.network.is_closed:
+                await asyncio.to_thread(self.wait_for_network)
+            try:
+                async with self.semaphore:
+                    await limiter.acquire_async()
+                    start = time.perf_counter()
+                    async with session.get(url, params=params, headers=headers) as response:
+                        content = await response.read()
+                        page = FetchedPage(str(response.url), response.status, response.headers, content)
+                    self.metrics.record_request(phase, time.perf_counter() - start, page.status_code, len(content))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if self.network and isinstance(e, aiohttp.ClientConnectorError):
+                    self.network.record_failure()
+                delay = self.retry_after_error(e, attempt, limiter, phase, url)
+                if delay is None:
+                    return None
+                await asyncio.sleep(delay)
+                continue
+
+            if self.network:
+                self.network.record_success()
+            outcome = self.check_response(page, attempt, limiter, phase, url)
+            if outcome != 'retry':
+                return page if outcome == 'ok' else None
+        return None
@@ -0,0 +1,227 @@
+import json
+import sqlite3
+import threading
+
+# İş öğesi durumları
+PENDING = 'pending'
+DONE = 'done'
+# Önceki taramalardan bilinen, bu yenileme taramasında henüz görülmemiş bayi
+STALE = 'stale'
+# Art arda birkaç çalışmada istenemeyen bayi; bekleyen iş sayılmaz
+FAILED = 'failed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS zips (
+    zip TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'pending'
+);
+CREATE TABLE IF NOT EXISTS pages (
+    zip TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    hrefs TEXT,
+    PRIMARY KEY (zip, page)
+);
+CREATE TABLE IF NOT EXISTS dealers (
+    customer_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'pending',
+    result TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Sonradan eklenen sütunlar: (tablo, sütun, tip)
+COLUMNS = [
+    ('zips', 'page_count', 'INTEGER'),
+    # Koşullu istekler ve değişiklik tespiti için bayi sayfası doğrulayıcıları
+    ('dealers', 'etag', 'TEXT'),
+    ('dealers', 'last_modified', 'TEXT'),
+    ('dealers', 'body_hash', 'TEXT'),
+    ('dealers', 'content_hash', 'TEXT'),
+    ('dealers', 'checked_at', 'REAL'),
+    ('dealers', 'attempts', 'INTEGER NOT NULL DEFAULT 0'),
+]
+
+DEALER_STATE = ('status', 'result', 'etag', 'last_modified', 'body_hash', 'content_hash', 'checked_at')
+
+
+class Frontier:
+    """(zip, page) ve customer_id iş öğelerini SQLite'ta tutan kalıcı tarama sınırı.
+
+    Her tamamlanan iş hemen diske yazılır; yarıda kalan bir çalışma aynı dosyayla
+    yeniden başlatıldığında tamamlanmış sayfa ve bayileri tekrar istemez.
+    """
+
+    def __init__(self, path='frontier.db'):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self.conn.commit()
+
+    def _migrate(self):
+        # Eski sürümlerin oluşturduğu dosyalara yeni sütunları ekle
+        for table, column, kind in COLUMNS:
+            existing = {row[1] for row in self.conn.execute(f'PRAGMA table_info({table})')}
+            if column not in existing:
+                self.conn.execute(f'ALTER TABLE {table} ADD COLUMN {column} {kind}')
+
+    def _write(self, sql, rows=None):
+        with self.lock:
+            if rows is None:
+                cursor = self.conn.execute(sql)
+            else:
+                cursor = self.conn.executemany(sql, rows)
+            self.conn.commit()
+            return cursor
+
+    def _read(self, sql, params=()):
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def reset(self):
+        with self.lock:
+            self.conn.executescript('DELETE FROM zips; DELETE FROM pages; DELETE FROM dealers; DELETE FROM meta;')
+            self.conn.commit()
+
+    def start_refresh(self):
+        """Yeni bir yenileme taraması başlatır: tüm ZIP'ler yeniden taranır, bilinen bayiler
+        doğrulayıcıları ve son sonuçlarıyla birlikte 'stale' olarak saklanır."""
+        with self.lock:
+            self.conn.executescript(f"""
+                UPDATE zips SET status = '{PENDING}', page_count = NULL;
+                DELETE FROM pages;
+                UPDATE dealers SET status = '{STALE}', attempts = 0;
+            """)
+            self.conn.commit()
+
+    def get_meta(self, key):
+        rows = self._read('SELECT value FROM meta WHERE key = ?', (key,))
+        return rows[0][0] if rows else None
+
+    def set_meta(self, key, value):
+        if value is None:
+            self._write('DELETE FROM meta WHERE key = ?', [(key,)])
+        else:
+            self._write('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', [(key, value)])
+
+    def add_zips(self, zip_codes):
+        self._write('INSERT OR IGNORE INTO zips (zip) VALUES (?)', [(str(z),) for z in zip_codes])
+
+    def pending_zips(self):
+        return [row[0] for row in self._read('SELECT zip FROM zips WHERE status = ?', (PENDING,))]
+
+    def page_count(self, zip_code):
+        rows = self._read('SELECT page_count FROM zips WHERE zip = ?', (str(zip_code),))
+        return rows[0][0] if rows else None
+
+    def set_page_count(self, zip_code, page_count):
+        self._write('UPDATE zips SET page_count = ? WHERE zip = ?', [(page_count, str(zip_code))])
+
+    def completed_pages(self, zip_code):
+        """Bir ZIP için tamamlanmış sayfaları {sayfa: href kümesi} olarak döndürür."""
+        rows = self._read('SELECT page, hrefs FROM pages WHERE zip = ? ORDER BY page', (str(zip_code),))
+        return {page: set(json.loads(hrefs)) if hrefs else set() for page, hrefs in rows}
+
+    def complete_page(self, zip_code, page, hrefs=None):
+        # href'ler yalnızca sayfa sayısı bilinmeyen (sıralı) sayfalamada gerekir
+        self._write('INSERT OR REPLACE INTO pages (zip, page, hrefs) VALUES (?, ?, ?)',
+                    [(str(zip_code), page, json.dumps(sorted(hrefs)) if hrefs is not None else None)])
+
+    def complete_zip(self, zip_code):
+        self._write('UPDATE zips SET status = ? WHERE zip = ?', [(DONE, str(zip_code))])
+
+    def add_customer_ids(self, customer_ids):
+        """Müşteri ID'lerini ekler ve bu taramada ilk kez görülenleri döndürür.
+
+        Yenileme taramasında önceki taramalardan bilinen ('stale') ID'ler de yeniden işlenmek
+        üzere bekliyor durumuna alınır ve döndürülür.
+        """
+        with self.lock:
+            new_ids = []
+            for cid in customer_ids:
+                cursor = self.conn.execute('INSERT OR IGNORE INTO dealers (customer_id) VALUES (?)', (str(cid),))
+                if not cursor.rowcount:
+                    cursor = self.conn.execute('UPDATE dealers SET status = ? WHERE customer_id = ? AND status = ?',
+                                               (PENDING, str(cid), STALE))
+                if cursor.rowcount:
+                    new_ids.append(str(cid))
+            self.conn.commit()
+            return new_ids
+
+    def pending_customer_ids(self):
+        return [row[0] for row in self._read('SELECT customer_id FROM dealers WHERE status = ?', (PENDING,))]
+
+    def customer_ids(self):
+        # Yenileme taramasında görülmeyen (kaybolan) bayiler dahil edilmez
+        return [row[0] for row in self._read('SELECT customer_id FROM dealers WHERE status != ?', (STALE,))]
+
+    def dealer_state(self, customer_id):
+        rows = self._read(f'SELECT {", ".join(DEALER_STATE)} FROM dealers WHERE customer_id = ?', (str(customer_id),))
+        if not rows:
+            return None
+        state = dict(zip(DEALER_STATE, rows[0]))
+        state['result'] = json.loads(state['result']) if state['result'] else None
+        return state
+
+    def pending_counts(self):
+        """Bekleyen (ZIP, bayi) sayılarını döndürür; ikisi de 0 ise tarama tamamlanmıştır."""
+        zips = self._read('SELECT COUNT(*) FROM zips WHERE status = ?', (PENDING,))[0][0]
+        dealers = self._read('SELECT COUNT(*) FROM dealers WHERE status = ?', (PENDING,))[0][0]
+        return zips, dealers
+
+    def fail_dealer(self, customer_id, max_attempts):
+        """Bayinin başarısız deneme sayısını artırır; `max_attempts`'e ulaşınca 'failed' yapıp True döndürür.
+
+        Böylece sürekli hata veren tek bir bayi yenileme taramasının bitmesini engellemez.
+        """
+        with self.lock:
+            self.conn.execute('UPDATE dealers SET attempts = attempts + 1 WHERE customer_id = ?', (str(customer_id),))
+            cursor = self.conn.execute('UPDATE dealers SET status = ? WHERE customer_id = ? AND attempts >= ?',
+                                       (FAILED, str(customer_id), max_attempts))
+            self.conn.commit()
+            return bool(cursor.rowcount)
+
+    def complete_dealer(self, customer_id, result, meta=None):
+        # Bayi adı bulunamayan sayfalar da tamamlanmış sayılır (result NULL kalır)
+        self.complete_dealers([(customer_id, result, meta)])
+
+    def complete_dealers(self, batch):
+        """(customer_id, satır, meta) üçlülerini tamamlandı olarak işaretler.
+
+        meta, sayfa yeniden indirildiyse tüm doğrulayıcıları (etag, last_modified, body_hash,
+        content_hash, checked_at), yalnızca doğrulandıysa (304) checked_at'i içerir; None ise
+        sadece durum güncellenir (TTL içinde yeniden kullanılan bayiler). {'carried_over': True}
+        ile yazılan satırlar (vazgeçilen bayilerin önceki sonuçları) frontier'da değiştirilmez.
+        """
+        fetched, validated, reused = [], [], []
+        for customer_id, result, meta in batch:
+            result = json.dumps(result) if result else None
+            if meta and meta.get('carried_over'):
+                continue  # vazgeçilen bayinin önceki satırı; durumu 'failed' kalır
+            if meta and 'body_hash' in meta:
+                fetched.append((DONE, result, meta.get('etag'), meta.get('last_modified'), meta['body_hash'],
+                                meta.get('content_hash'), meta['checked_at'], str(customer_id)))
+            elif meta:
+                validated.append((DONE, meta['checked_at'], str(customer_id)))
+            else:
+                reused.append((DONE, str(customer_id)))
+
+        with self.lock:
+            self.conn.executemany('UPDATE dealers SET status = ?, result = ?, etag = ?, last_modified = ?, body_hash = ?, '
+                                  'content_hash = ?, checked_at = ? WHERE customer_id = ?', fetched)
+            self.conn.executemany('UPDATE dealers SET status = ?, checked_at = ? WHERE customer_id = ?', validated)
+            self.conn.executemany('UPDATE dealers SET status = ? WHERE customer_id = ?', reused)
+            self.conn.commit()
+
+    def is_empty(self):
+        return not self._read('SELECT 1 FROM dealers LIMIT 1')
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
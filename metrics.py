@@ -0,0 +1,232 @@
+import bisect
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Gecikme kovalarının üst sınırları (ms); son kova sınırsızdır
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """Sabit kovalı gecikme histogramı; yüzdelikler kova sınırlarından tahmin edilir."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        self.counts[bisect.bisect_left(self.buckets, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, q):
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self):
+        labels = [f'<={bound}' for bound in self.buckets] + [f'>{self.buckets[-1]}']
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count, 2) if self.count else None,
+            'p50_ms': self.percentile(0.5),
+            'p90_ms': self.percentile(0.9),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': round(self.max, 2),
+            'buckets': {label: count for label, count in zip(labels, self.counts) if count},
+        }
+
+
+class PhaseStats:
+    def __init__(self):
+        self.requests = 0
+        self.bytes = 0
+        self.retries = 0
+        self.throttles = 0
+        self.errors = 0
+        self.failures = 0
+        self.statuses = {}
+        self.latency = Histogram()
+        self.parse = Histogram()
+
+    def summary(self, elapsed):
+        return {
+            'requests': self.requests,
+            'requests_per_sec': round(self.requests / elapsed, 2) if elapsed else None,
+            'bytes': self.bytes,
+            'retries': self.retries,
+            'throttles': self.throttles,
+            'errors': self.errors,
+            'failures': self.failures,
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'latency': self.latency.summary(),
+            'parse': self.parse.summary(),
+        }
+
+
+class Metrics:
+    """Tarama boyunca aşama (search/dealer) bazında istek, ayrıştırma ve kuyruk ölçümleri.
+
+    Thread'ler ve asyncio aynı nesneyi paylaşır; her kayıt kısa bir kilit altında
+    yalnızca sayaç günceller, çıktı üretmez. Canlı satır ayrı bir thread'den yazılır.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.phases = {}
+        self.levels = {}  # kuyruk derinlikleri gibi artıp azalan değerler
+        self.gauges = {}  # okunduğu anda hesaplanan değerler
+        self.started = time.monotonic()
+        self.progress_thread = None
+        self.progress_stop = threading.Event()
+
+    def phase(self, name):
+        stats = self.phases.get(name)
+        if stats is None:
+            with self.lock:
+                stats = self.phases.setdefault(name, PhaseStats())
+        return stats
+
+    def record_request(self, phase, seconds, status, nbytes=0):
+        stats = self.phase(phase)
+        with self.lock:
+            stats.requests += 1
+            stats.bytes += nbytes
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.latency.add(seconds * 1000)
+
+    def record_error(self, phase):
+        """Yanıt alınamayan (bağlantı/zaman aşımı) bir deneme."""
+        stats = self.phase(phase)
+        with self.lock:
+            stats.errors += 1
+
+    def record_retry(self, phase, throttled=False):
+        stats = self.phase(phase)
+        with self.lock:
+            stats.retries += 1
+            stats.throttles += throttled
+
+    def record_failure(self, phase, throttled=False):
+        """Tüm denemeleri tükenen bir istek."""
+        stats = self.phase(phase)
+        with self.lock:
+            stats.failures += 1
+            stats.throttles += throttled
+
+    @contextmanager
+    def parsing(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self.phase(phase)
+            with self.lock:
+                stats.parse.add(elapsed * 1000)
+
+    def adjust(self, name, delta):
+        with self.lock:
+            self.levels[name] = self.levels.get(name, 0) + delta
+
+    def set_level(self, name, value):
+        with self.lock:
+            self.levels[name] = value
+
+    def add_gauge(self, name, read):
+        self.gauges[name] = read
+
+    def queue_depths(self):
+        depths = dict(self.levels)
+        for name, read in self.gauges.items():
+            try:
+                depths[name] = read()
+            except Exception:
+                depths[name] = None
+        return depths
+
+    def totals(self):
+        with self.lock:
+            phases = list(self.phases.values())
+            return {
+                'requests': sum(stats.requests for stats in phases),
+                'bytes': sum(stats.bytes for stats in phases),
+                'retries': sum(stats.retries for stats in phases),
+                'throttles': sum(stats.throttles for stats in phases),
+                'errors': sum(stats.errors for stats in phases),
+                'failures': sum(stats.failures for stats in phases),
+            }
+
+    def summary(self):
+        elapsed = time.monotonic() - self.started
+        totals = self.totals()
+        with self.lock:
+            phases = {name: stats.summary(elapsed) for name, stats in self.phases.items()}
+        return {
+            'elapsed_sec': round(elapsed, 3),
+            **totals,
+            'requests_per_sec': round(totals['requests'] / elapsed, 2) if elapsed else None,
+            'phases': phases,
+            'queue_depths': self.queue_depths(),
+        }
+
+    def progress_line(self, recent_rate=None):
+        elapsed = time.monotonic() - self.started
+        totals = self.totals()
+        rate = totals['requests'] / elapsed if recent_rate is None else recent_rate
+        with self.lock:
+            phases = ' '.join(f"{name} {stats.requests} p50 {stats.latency.percentile(0.5) or 0:.0f}ms"
+                              for name, stats in self.phases.items())
+        queues = ' '.join(f"{name}={depth}" for name, depth in self.queue_depths().items())
+        return (f"[{elapsed:7.1f}s] {totals['requests']} req {rate:6.1f}/s | {phases} | "
+                f"{totals['bytes'] / 1e6:.1f} MB | retry {totals['retries']} throttle {totals['throttles']} "
+                f"fail {totals['failures']} | queue {queues}")
+
+    def start_progress(self, interval=1.0, stream=None):
+        """Her `interval` saniyede bir tek satırlık ilerleme yazar (terminalde aynı satırı günceller)."""
+        stream = stream or sys.stderr
+        live = stream.isatty()
+        self.progress_stop.clear()
+
+        def report():
+            last_requests, last_time = 0, time.monotonic()
+            while not self.progress_stop.wait(interval):
+                now, requests = time.monotonic(), self.totals()['requests']
+                line = self.progress_line((requests - last_requests) / (now - last_time))
+                last_requests, last_time = requests, now
+                stream.write(f"\r{line}\x1b[K" if live else line + '\n')
+                stream.flush()
+            if live:
+                stream.write('\n')
+                stream.flush()
+
+        self.progress_thread = threading.Thread(target=report, name='progress', daemon=True)
+        self.progress_thread.start()
+
+    def stop_progress(self):
+        if self.progress_thread:
+            self.progress_stop.set()
+            self.progress_thread.join()
+            self.progress_thread = None
+
+    def write_summary(self, path=None, stream=None, **extra):
+        """Çalışma sonu özetini (`extra` alanlarıyla) JSON olarak `stream`'e yazdırır ve `path`'e kaydeder."""
+        summary = {**self.summary(), **extra}
+        if stream is not None:
+            stream.write(json.dumps(summary, indent=2) + '\n')
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=2)
+        return summary
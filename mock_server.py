@@ -0,0 +1,207 @@
+import argparse
+import hashlib
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Kayıtlı sayfalarda istek başına değiştirilen alanlar
+SEARCH_SLOTS = re.compile(r'(?P<listing>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})'
+                          r'|(?<="customer_id": ")(?P<customer>\d+)'
+                          r'|(?<="search_zip": ")(?P<zip>\d+)'
+                          r'|(?<=<span class="total-filter-count">)(?P<total>[\d,]+)')
+DEALER_SLOTS = re.compile(r'(?<=/dealers/)(?P<customer>\d+)|(?P<name>Destination Motors)')
+
+
+def compile_template(text, pattern):
+    """Sayfayı sabit parçalara ve (alan, özgün değer) yuvalarına böler; her istekte yalnızca birleştirilir."""
+    parts = []
+    position = 0
+    for match in pattern.finditer(text):
+        parts.append(text[position:match.start()])
+        parts.append((match.lastgroup, match.group()))
+        position = match.end()
+    parts.append(text[position:])
+    return parts
+
+
+def render(parts, fill):
+    return ''.join(fill(*part) if isinstance(part, tuple) else part for part in parts).encode('utf-8')
+
+
+class MockCarsServer:
+    """fixtures/ altındaki kayıtlı cars.com sayfalarını yeniden oynatan yerel sunucu.
+
+    Her ZIP için `pages` sayfa ilan döner; ilan ve müşteri ID'leri (zip, sayfa) başına
+    değiştirilir, böylece CarsScraper gerçek sayfa boyutlarında uçtan uca çalışır.
+    Yanıt gecikmesi, yeni bağlantı kurulum gecikmesi (`connect_latency`, TCP+TLS el sıkışmasının
+    yerine) ve 5xx/429 hata oranları ayarlanabilir.
+    """
+
+    def __init__(self, pages=3, dealers=300, latency=0.02, jitter=0.0, error_rate=0.0, throttle_rate=0.0,
+                 retry_after=1, fixtures=FIXTURES_DIR, seed=None, host='127.0.0.1', port=0, connect_latency=0.0):
+        self.pages = pages
+        self.dealers = dealers
+        self.latency = latency
+        self.jitter = jitter
+        self.connect_latency = connect_latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {'connections': 0, 'requests': 0, 'bytes': 0, 'errors': 0, 'throttles': 0, 'not_modified': 0}
+
+        with open(os.path.join(fixtures, 'search_results.html'), encoding='utf-8') as f:
+            self.search_template = compile_template(f.read(), SEARCH_SLOTS)
+        with open(os.path.join(fixtures, 'dealer.html'), encoding='utf-8') as f:
+            self.dealer_template = compile_template(f.read(), DEALER_SLOTS)
+        self.listings_per_page = len({part[1] for part in self.search_template
+                                      if isinstance(part, tuple) and part[0] == 'listing'})
+
+        self.server = ThreadingHTTPServer((host, port), self.make_handler())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def search_page(self, zip_code, page):
+        page = min(page, self.pages)  # son sayfadan sonrası son sayfayı tekrarlar
+        listings = {}
+        customers = iter(range(self.listings_per_page))
+
+        def fill(slot, original):
+            if slot == 'listing':
+                index = listings.setdefault(original, len(listings))
+                return f'{index:08x}-0000-{page:04x}-0000-{int(zip_code):012x}'
+            if slot == 'customer':
+                return str((int(zip_code) * 7 + next(customers, 0)) % self.dealers + 1000)
+            if slot == 'zip':
+                return str(zip_code)
+            return f'{self.pages * self.listings_per_page:,}'
+
+        return render(self.search_template, fill)
+
+    def dealer_page(self, customer_id):
+        return render(self.dealer_template,
+                      lambda slot, original: customer_id if slot == 'customer' else f'Dealer {customer_id}')
+
+    def count(self, key, amount=1):
+        with self.lock:
+            self.counts[key] += amount
+
+    def make_handler(self):
+        server = self
+
+        class MockHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def setup(self):
+                # Her yeni bağlantı kurulum maliyetini bir kez öder; keep-alive bağlantılar tekrar ödemez
+                server.count('connections')
+                if server.connect_latency:
+                    time.sleep(server.connect_latency)
+                super().setup()
+
+            def do_GET(self):
+                server.count('requests')
+                delay = server.latency + (server.random.uniform(0, server.jitter) if server.jitter else 0)
+                if delay:
+                    time.sleep(delay)
+
+                roll = server.random.random()
+                if roll < server.throttle_rate:
+                    server.count('throttles')
+                    self.send_empty(429, {'Retry-After': str(server.retry_after)})
+                    return
+                if roll < server.throttle_rate + server.error_rate:
+                    server.count('errors')
+                    self.send_empty(503)
+                    return
+
+                url = urlparse(self.path)
+                if url.path.startswith('/shopping/results'):
+                    query = parse_qs(url.query)
+                    body = server.search_page(query['zip'][0], int(query.get('page', ['1'])[0]))
+                elif url.path.startswith('/dealers/'):
+                    body = server.dealer_page(url.path.strip('/').split('/')[1])
+                else:
+                    self.send_empty(404)
+                    return
+
+                # Bayi sayfaları ETag ile doğrulanabilir (artımlı tarama için)
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if url.path.startswith('/dealers/') and self.headers.get('If-None-Match') == etag:
+                    server.count('not_modified')
+                    self.send_empty(304, {'ETag': etag})
+                    return
+
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                server.count('bytes', len(body))
+
+            def send_empty(self, status, headers=None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        return MockHandler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name='mock-cars', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve fixture pages as a local mock cars.com.")
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--pages', type=int, default=3, help="result pages per ZIP")
+    parser.add_argument('--dealers', type=int, default=300, help="distinct dealers across all ZIPs")
+    parser.add_argument('--latency', type=float, default=0.02, help="seconds of delay per response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="extra random delay (0..jitter seconds)")
+    parser.add_argument('--connect-latency', type=float, default=0.0,
+                        help="seconds of delay per new connection (stands in for the TCP+TLS handshake)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of responses that are 503")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="fraction of responses that are 429")
+    args = parser.parse_args()
+
+    server = MockCarsServer(pages=args.pages, dealers=args.dealers, latency=args.latency, jitter=args.jitter,
+                            error_rate=args.error_rate, throttle_rate=args.throttle_rate, port=args.port,
+                            connect_latency=args.connect_latency)
+    print(f"Serving mock cars.com on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        server.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# Site bizi yavaşlatmak istediğinde dönen kodlar (bot koruması dahil)
+THROTTLE_STATUSES = {403, 429}
+
+
+def parse_retry_after(value):
+    """Retry-After başlığını saniyeye çevirir (saniye veya HTTP tarihi); geçersizse None."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateController:
+    """Tek bir host için AIMD ile ayarlanan token bucket.
+
+    Sağlıklı her yanıtta hız, saniyede yaklaşık `increase` istek/sn artar; 429/403/5xx
+    yanıtlarında yarıya iner ve Retry-After'a (yoksa jitter'lı üstel beklemeye) göre
+    host kısa süre tamamen durdurulur. Hem thread'ler hem asyncio aynı nesneyi paylaşır.
+
+    Bekleme süresi önceden ayrılmaz: her uyanışta güncel hız ve blokaj yeniden kontrol
+    edilir, böylece sonradan gelen bir 429 zaten beklemekte olan istekleri de durdurur.
+    """
+
+    def __init__(self, initial_rate=5.0, min_rate=0.5, max_rate=50.0, burst=5, increase=1.0,
+                 decrease=0.5, backoff_base=2.0, max_backoff=120.0):
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.lock = threading.Lock()
+        self.tat = time.monotonic()  # GCRA "teorik varış zamanı"
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.consecutive_throttles = 0
+
+    def reserve(self):
+        """İstek hakkı şimdi varsa alır ve 0 döndürür; yoksa hiçbir şey ayırmadan beklenecek saniyeyi döndürür."""
+        with self.lock:
+            now = time.monotonic()
+            interval = 1.0 / self.rate
+            allowed_at = max(self.tat - (self.burst - 1) * interval, self.blocked_until)
+            if allowed_at > now:
+                return allowed_at - now
+            self.tat = max(self.tat, now) + interval
+            return 0
+
+    def acquire(self):
+        while (wait := self.reserve()):
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        while (wait := self.reserve()):
+            await asyncio.sleep(wait)
+
+    def record(self, status, retry_after=None):
+        """Yanıt durumunu bildirir; yanıt bir yavaşlatma ise True döndürür."""
+        throttled = status in THROTTLE_STATUSES or status >= 500
+        with self.lock:
+            now = time.monotonic()
+            if not throttled:
+                self.consecutive_throttles = 0
+                self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+                return False
+
+            self.consecutive_throttles += 1
+            # Aynı anda dönen bir grup 429 hızı yalnızca bir kez düşürsün
+            if now - self.last_decrease >= 1.0 / self.rate:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self.last_decrease = now
+
+            delay = parse_retry_after(retry_after)
+            if delay is None:
+                delay = min(self.max_backoff, self.backoff_base * 2 ** (self.consecutive_throttles - 1))
+                delay *= random.uniform(0.5, 1.5)
+            self.blocked_until = max(self.blocked_until, now + delay)
+            return True
+
+    def backoff(self, attempt, base=None):
+        """Ağ hataları için jitter'lı üstel bekleme süresi."""
+        base = self.backoff_base if base is None else base
+        return min(self.max_backoff, base * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+class HostRateLimiter:
+    """Her host için ayrı bir RateController tutar."""
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self.controllers = {}
+        self.lock = threading.Lock()
+
+    def for_url(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.controllers:
+                self.controllers[host] = RateController(**self.settings)
+            return self.controllers[host]
+
+
+class NetworkHealth:
+    """Ağ bağlantısı için devre kesici.
+
+    Her istekten önce bağlantı yoklamak yerine, art arda `failure_threshold` bağlantı
+    hatasından sonra devre açılır; `reset_timeout` sonra tek bir yoklama yapılır ve
+    başarılıysa devre kapanır.
+    """
+
+    def __init__(self, probe, failure_threshold=5, reset_timeout=30.0):
+        self.probe = probe
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.open_until = None
+
+    @property
+    def is_closed(self):
+        return self.open_until is None
+
+    def record_success(self):
+        if self.failures or self.open_until is not None:
+            with self.lock:
+                self.failures = 0
+                self.open_until = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.open_until is None and self.failures >= self.failure_threshold:
+                print(f"Network looks down. Pausing requests for {self.reset_timeout:.0f} seconds...")
+                self.open_until = time.monotonic() + self.reset_timeout
+
+    def check(self):
+        """İstek gönderilebiliyorsa 0, değilse beklenecek saniyeyi döndürür."""
+        with self.lock:
+            if self.open_until is None:
+                return 0
+            now = time.monotonic()
+            if now < self.open_until:
+                return self.open_until - now
+            # Yarı açık: tek bir yoklama
+            if self.probe():
+                print("Network is back. Resuming requests.")
+                self.failures = 0
+                self.open_until = None
+                return 0
+            print(f"No internet connection. Retrying in {self.reset_timeout:.0f} seconds...")
+            self.open_until = now + self.reset_timeout
+            return self.reset_timeout
@@ -0,0 +1,238 @@
+import csv
+import json
+import os
+import queue
+import threading
+import time
+
+# parse_dealer_page'in her satırda ürettiği sabit sütunlar; geri kalanlar telefon başlıklarıdır
+BASE_COLUMNS = ["dealer_name", "dealer_website", "dealer_direction_link", "dealer_address", "URL"]
+
+FORMATS = ('csv', 'jsonl', 'parquet')
+# Önceki anlık görüntüler (ör. eski dealers.xlsx) okunabilir ama yazılmaz
+READ_FORMATS = FORMATS + ('xlsx',)
+
+
+def detect_format(path, formats=FORMATS):
+    ext = os.path.splitext(path.rstrip('/'))[1].lstrip('.').lower()
+    if ext not in formats:
+        raise ValueError(f"Unknown output format for {path!r} (expected one of {', '.join(formats)})")
+    return ext
+
+
+class CsvSink:
+    """Dinamik telefon sütunlarını destekleyen CSV çıktısı.
+
+    Yeni bir telefon başlığı geldiğinde yalnızca başlık satırı genişletilir; dosya
+    satır satır yeniden yazıldığı için bellek kullanımı satır sayısından bağımsızdır.
+    """
+
+    def __init__(self, path, append, columns=BASE_COLUMNS):
+        self.path = path
+        if append and os.path.exists(path) and os.path.getsize(path):
+            with open(path, newline='', encoding='utf-8') as f:
+                self.columns = next(csv.reader(f))
+        else:
+            self.columns = list(columns)
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerow(self.columns)
+        self.file = open(path, 'a', newline='', encoding='utf-8')
+
+    def _extend_header(self, new_columns):
+        self.file.close()
+        columns = self.columns + new_columns
+        tmp_path = self.path + '.tmp'
+        with open(self.path, newline='', encoding='utf-8') as src, \
+                open(tmp_path, 'w', newline='', encoding='utf-8') as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
+            next(reader, None)
+            writer.writerow(columns)
+            for row in reader:
+                writer.writerow(row + [''] * (len(columns) - len(row)))
+        os.replace(tmp_path, self.path)
+        self.columns = columns
+        self.file = open(self.path, 'a', newline='', encoding='utf-8')
+
+    def write_batch(self, rows):
+        new_columns = list(dict.fromkeys(key for row in rows for key in row if key not in self.columns))
+        if new_columns:
+            self._extend_header(new_columns)
+        csv.DictWriter(self.file, fieldnames=self.columns, restval='').writerows(rows)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class JsonlSink:
+    def __init__(self, path, append, columns=BASE_COLUMNS):
+        self.file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write_batch(self, rows):
+        for row in rows:
+            self.file.write(json.dumps(row, ensure_ascii=False) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetSink:
+    """Parquet çıktısı: `path` bir dizindir, her flush ayrı bir parça dosyasıdır.
+
+    Sabit sütunlar dışındaki alanlar (bayilerde telefon numaraları) şemayı sabit tutmak için
+    `phones` adlı map<string, string> sütununda tutulur.
+    Her parça kapatıldığı anda okunabilir olduğundan çökme durumunda flush edilmiş veri kaybolmaz.
+    """
+
+    def __init__(self, path, append, columns=BASE_COLUMNS):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow).")
+        self.pa, self.pq = pa, pq
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        if not append:
+            for name in os.listdir(path):
+                if name.endswith('.parquet'):
+                    os.remove(os.path.join(path, name))
+        self.columns = list(columns)
+        self.schema = pa.schema([(column, pa.string()) for column in self.columns] +
+                                [('phones', pa.map_(pa.string(), pa.string()))])
+        self.prefix = f"part-{int(time.time() * 1000)}"
+        self.parts = 0
+
+    def write_batch(self, rows):
+        columns = {column: [row.get(column) for row in rows] for column in self.columns}
+        columns['phones'] = [[(k, v) for k, v in row.items() if k not in self.columns] for row in rows]
+        table = self.pa.Table.from_pydict(columns, schema=self.schema)
+        self.pq.write_table(table, os.path.join(self.path, f"{self.prefix}-{self.parts:05d}.parquet"))
+        self.parts += 1
+
+    def close(self):
+        pass
+
+
+SINKS = {'csv': CsvSink, 'jsonl': JsonlSink, 'parquet': ParquetSink}
+
+
+class RowWriter:
+    """Satırları (bayiler, katalog ürünleri) kuyruktan okuyup toplu halde diske yazan tek tüketici thread.
+
+    Her toplu yazımdan sonra `on_flush(batch)` çağrılır; batch (anahtar, satır, meta) üçlülerinden oluşur.
+    `columns` sabit sütunlardır; varsayılan bayi sütunlarıdır.
+    """
+
+    def __init__(self, path, fmt=None, append=True, batch_size=500, flush_interval=5.0, on_flush=None,
+                 columns=BASE_COLUMNS):
+        self.path = path
+        self.format = fmt or detect_format(path)
+        self.sink = SINKS[self.format](path, append, columns)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_flush = on_flush
+        self.queue = queue.Queue(maxsize=batch_size * 4)
+        self.rows_written = 0
+        self.error = None
+        self.thread = threading.Thread(target=self._consume, name='row-writer', daemon=True)
+        self.thread.start()
+
+    def put(self, key, row, meta=None):
+        if self.error:
+            raise RuntimeError("Row writer failed") from self.error
+        self.queue.put((key, row, meta))
+
+    def _flush(self, batch):
+        if not batch:
+            return
+        self.sink.write_batch([row for _, row, _ in batch])
+        self.rows_written += len(batch)
+        if self.on_flush:
+            self.on_flush(batch)
+        batch.clear()
+
+    def _consume(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        try:
+            while True:
+                try:
+                    item = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    item = None
+                if item is not None and item[0] is None:  # kapanış işareti
+                    break
+                if item is not None:
+                    batch.append(item)
+                if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                    self._flush(batch)
+                    deadline = time.monotonic() + self.flush_interval
+            self._flush(batch)
+        except Exception as e:
+            self.error = e
+            # Üreticiler takılı kalmasın diye kuyruğu boşalt
+            while True:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    break
+        finally:
+            self.sink.close()
+
+    def close(self):
+        self.queue.put((None, None, None))
+        self.thread.join()
+        if self.error:
+            raise RuntimeError("Row writer failed") from self.error
+
+
+def iter_rows(path, fmt=None):
+    """Akışla yazılmış bir çıktı dosyasını satır satır dict olarak okur."""
+    fmt = fmt or detect_format(path, READ_FORMATS)
+    if fmt == 'csv':
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                yield {k: v for k, v in row.items() if v != ''}
+    elif fmt == 'jsonl':
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif fmt == 'xlsx':
+        from openpyxl import load_workbook
+        wb = load_workbook(path, read_only=True)
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, ())
+        for values in rows:
+            yield {k: str(v) for k, v in zip(header, values) if k and v is not None and v != ''}
+        wb.close()
+    else:
+        import pyarrow.parquet as pq
+        for name in sorted(os.listdir(path)):
+            if not name.endswith('.parquet'):
+                continue
+            for record_batch in pq.ParquetFile(os.path.join(path, name)).iter_batches():
+                for record in record_batch.to_pylist():
+                    phones = record.pop('phones') or []
+                    record.update(phones)
+                    yield {k: v for k, v in record.items() if v is not None}
+
+
+def export_excel(source, filename="dealers.xlsx", fmt=None, columns=BASE_COLUMNS):
+    """Akışla yazılmış dosyadan Excel üretir (write-only modda, satırlar bellekte tutulmaz)."""
+    from openpyxl import Workbook
+
+    # İlk geçiş: telefon başlıklarıyla birlikte tüm sütunları bul
+    columns = list(columns)
+    for row in iter_rows(source, fmt):
+        columns.extend(key for key in row if key not in columns)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(columns)
+    for row in iter_rows(source, fmt):
+        ws.append([row.get(column) for column in columns])
+    wb.save(filename)
@@ -0,0 +1,171 @@
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from fetcher import Fetcher
+from metrics import Metrics
+from rate_control import HostRateLimiter
+from row_writer import RowWriter, export_excel
+
+# Ürün sayfasındaki tek bir alan: CSS seçici, okunacak özellik (yoksa metin) ve zorunluluk.
+# Zorunlu bir alan bulunamazsa ürün atlanır; diğer eksik alanlar boş bırakılır.
+Field = namedtuple('Field', ['selector', 'attr', 'required'], defaults=(None, False))
+
+# Bir sitenin bildirimsel tanımı:
+#   listing_url   '{page}' içeren liste sayfası kalıbı
+#   pages         sayfa numaraları; None ise yeni bağlantı gelmeyene kadar sayfa sayfa ilerlenir
+#   link_selector liste sayfasında ürün bağlantılarını seçen CSS seçici
+#   fields        çıktı sütunu -> Field
+#   output        akışla yazılan çıktı dosyası (csv, jsonl veya parquet)
+#   excel         isteğe bağlı: tarama sonunda çıktıdan üretilecek Excel dosyası
+SiteSpec = namedtuple('SiteSpec', ['name', 'listing_url', 'pages', 'link_selector', 'fields', 'output', 'excel'],
+                      defaults=(None,))
+
+
+class SiteScraper:
+    """SiteSpec ile tanımlanan bir kataloğu havuzlu ve eşzamanlı olarak tarar.
+
+    Liste sayfaları eşzamanlı istenir ve bulunan her ürün sayfası hemen kuyruğa alınır.
+    Her ürün kendi içinde hata yakalar; bir ürünün hatası taramayı durdurmaz. Satırlar
+    RowWriter ile akışla yazılır.
+    """
+
+    def __init__(self, spec, concurrency=8, initial_rate=5.0, max_rate=50.0, headers=None, verbose=False,
+                 progress_interval=1.0):
+        self.spec = spec
+        self.concurrency = concurrency
+        self.headers = headers or {}
+        self.verbose = verbose
+        self.progress_interval = progress_interval
+        self.rate_limiter = HostRateLimiter(initial_rate=initial_rate, max_rate=max_rate)
+        self.metrics = Metrics()
+        self.fetcher = Fetcher(self.rate_limiter, self.metrics, concurrency=concurrency, headers=self.headers,
+                               retry_delay=2, log=self.log)
+        self.failed = []
+        self.lock = threading.Lock()
+
+    def log(self, message):
+        if self.verbose:
+            print(message)
+
+    def parse_listing(self, content, url):
+        """Liste sayfasındaki ürün bağlantılarını sırasıyla ve mutlak olarak döndürür."""
+        soup = BeautifulSoup(content, 'html.parser')
+        links = (urljoin(url, a['href']) for a in soup.select(self.spec.link_selector) if a.get('href'))
+        return list(dict.fromkeys(links))
+
+    def parse_item(self, content, url):
+        """Ürün sayfasındaki alanları çıkarır; zorunlu bir alan yoksa None döndürür."""
+        soup = BeautifulSoup(content, 'html.parser')
+        item = {}
+        for column, field in self.spec.fields.items():
+            tag = soup.select_one(field.selector)
+            value = None
+            if tag is not None:
+                value = tag.get(field.attr) if field.attr else tag.get_text()
+                value = value.strip() if isinstance(value, str) else value
+                if value and field.attr in ('href', 'src'):
+                    value = urljoin(url, value)
+            if not value and field.required:
+                return None
+            item[column] = value
+        item['URL'] = url
+        return item
+
+    def fetch_listing(self, page):
+        url = self.spec.listing_url.format(page=page)
+        self.log(f"Fetching listing page {page}: {url}")
+        response = self.fetcher.fetch(url, phase='listing')
+        if response is None:
+            return None
+        with self.metrics.parsing('listing'):
+            return self.parse_listing(response.content, response.url)
+
+    def process_item(self, url):
+        """Tek bir ürünü isteyip yazar; ürünün hatası yalnızca o ürünü etkiler."""
+        try:
+            response = self.fetcher.fetch(url, phase='item')
+            if response is None:
+                self.record_failed(url)
+                return
+            with self.metrics.parsing('item'):
+                item = self.parse_item(response.content, response.url)
+            if item is None:
+                print(f"Required field missing on {url}; skipping.")
+                self.record_failed(url)
+                return
+            self.log(item)
+            self.writer.put(url, item)
+        except Exception as e:
+            print(f"Failed to process {url}: {e!r}")
+            self.record_failed(url)
+        finally:
+            self.metrics.adjust('items', -1)
+
+    def record_failed(self, url):
+        with self.lock:
+            self.failed.append(url)
+
+    def dispatch_items(self, links):
+        # Daha önce görülmemiş ürünler hemen kuyruğa alınır
+        with self.lock:
+            new_links = [link for link in links if link not in self.seen]
+            self.seen.update(new_links)
+        for link in new_links:
+            self.metrics.adjust('items', 1)
+            self.item_futures.append(self.item_executor.submit(self.process_item, link))
+        return new_links
+
+    def crawl_listings(self, listing_executor):
+        if self.spec.pages is not None:
+            # Sayfa sayısı belli: tüm liste sayfaları eşzamanlı istenir, biten sayfanın ürünleri hemen kuyruğa alınır
+            futures = {listing_executor.submit(self.fetch_listing, page): page for page in self.spec.pages}
+            for future in as_completed(futures):
+                links = future.result()
+                if links is None:
+                    self.record_failed(self.spec.listing_url.format(page=futures[future]))
+                else:
+                    self.dispatch_items(links)
+            return
+
+        # Sayfa sayısı bilinmiyor: yeni ürün gelmeyene kadar sayfa sayfa ilerle
+        page = 0
+        while True:
+            links = self.fetch_listing(page)
+            if links is None:
+                self.record_failed(self.spec.listing_url.format(page=page))
+                break
+            if not self.dispatch_items(links):
+                self.log(f"No new items on listing page {page}. Stopping...")
+                break
+            page += 1
+
+    def run(self):
+        columns = list(self.spec.fields) + ['URL']
+        self.writer = RowWriter(self.spec.output, append=False, columns=columns)
+        self.metrics = self.fetcher.metrics = Metrics()
+        self.metrics.set_level('items', 0)
+        self.metrics.add_gauge('writer', self.writer.queue.qsize)
+        self.seen = set()
+        self.failed = []
+        self.item_futures = []
+        if self.progress_interval:
+            self.metrics.start_progress(self.progress_interval)
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as listing_executor, \
+                    ThreadPoolExecutor(max_workers=self.concurrency) as item_executor:
+                self.item_executor = item_executor
+                self.crawl_listings(listing_executor)
+                wait(self.item_futures)
+        finally:
+            self.writer.close()
+            self.metrics.stop_progress()
+
+        print(f"{self.spec.name}: {self.writer.rows_written} items written to {self.spec.output}, "
+              f"{len(self.failed)} failed in {self.metrics.summary()['elapsed_sec']:.1f}s")
+        if self.spec.excel:
+            export_excel(self.spec.output, self.spec.excel, columns=columns)
+        return self.failed
@@ -0,0 +1,231 @@
+import argparse
+import heapq
+import math
+import os
+import re
+from collections import Counter
+import numpy as np
+import pandas as pd
+
+EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE = 69.0
+
+# cars.com arama sayfasının kabul ettiği maximum_distance değerleri (mil)
+SEARCH_RADII = (10, 20, 30, 40, 50, 75, 100, 150, 200, 250, 500)
+
+# Bayi adresindeki eyalet kodu ve ZIP: "820 Russell Ave Gaithersburg, MD 20879, External link"
+ADDRESS_ZIP_RE = re.compile(r'\b[A-Z]{2},? (\d{5})(?:-\d{4})?\b')
+
+
+def build_index(locale_path='ZIP_Locale_Detail USA.xlsx', cities_path='results.csv', out_path='zip_index.csv'):
+    """ZIP_Locale_Detail'deki tüm teslimat ZIP'lerinden koordinatlı, kompakt bir indeks üretir.
+
+    Koordinatlar yalnızca bu adımda `zipcodes` paketinden alınır; planlama sırasında
+    sadece üretilen CSV okunur.
+    """
+    import zipcodes
+
+    detail = pd.read_excel(locale_path, sheet_name='ZIP_DETAIL', dtype=str)
+    unique = pd.read_excel(locale_path, sheet_name='Unique_ZIP_DETAIL', dtype=str)
+    zips = pd.concat([detail['DELIVERY ZIPCODE'], unique['ZIP CODE']]).dropna().str.zfill(5).unique()
+
+    # car.py'nin ürettiği şehir -> ZIP eşlemesi: cars.com'un büyük pazar merkezleri
+    cities = pd.read_csv(cities_path, dtype=str)
+    metro = set(cities['ZIP Value'].dropna().str.zfill(5))
+
+    rows = []
+    for zip_code in sorted(set(zips) | metro):
+        match = zipcodes.matching(zip_code)
+        if not match:
+            continue
+        rows.append({
+            'ZIP': int(zip_code),
+            'LAT': round(float(match[0]['lat']), 4),
+            'LON': round(float(match[0]['long']), 4),
+            'STATE': match[0]['state'],
+            'METRO': int(zip_code in metro),
+        })
+
+    df = pd.DataFrame(rows)
+    df.to_csv(out_path, index=False)
+    print(f'Wrote {len(df)} ZIPs ({df["METRO"].sum()} metro) to {out_path}.')
+    return df
+
+
+def load_dealer_zips(path='dealers.xlsx'):
+    """Bilinen bayilerin adreslerindeki ZIP'leri döndürür (bayi başına bir; adresi okunamayanlar hariç)."""
+    from row_writer import iter_rows
+
+    zips = []
+    for row in iter_rows(path):
+        match = ADDRESS_ZIP_RE.search(str(row.get('dealer_address') or ''))
+        if match:
+            zips.append(int(match.group(1)))
+    return zips
+
+
+class ZipPlanner:
+    def __init__(self, index_path='zip_index.csv'):
+        df = pd.read_csv(index_path)
+        self.zips = df['ZIP'].to_numpy()
+        self.lat = np.radians(df['LAT'].to_numpy())
+        self.lon = np.radians(df['LON'].to_numpy())
+        self.metro = df['METRO'].to_numpy().astype(bool)
+        self.position = {zip_code: i for i, zip_code in enumerate(self.zips)}
+
+    def _grid(self, radius):
+        # Hücre boyu yarıçapa eşit; bir noktanın komşuları en fazla bitişik hücrelerdedir
+        cell = math.radians(radius / MILES_PER_DEGREE)
+        keys = np.stack([np.floor(self.lat / cell), np.floor(self.lon / cell)], axis=1).astype(int)
+        grid = {}
+        for i, key in enumerate(map(tuple, keys)):
+            grid.setdefault(key, []).append(i)
+        return cell, {key: np.array(members) for key, members in grid.items()}
+
+    def coverage_sets(self, radius, target_mask):
+        """Her aday ZIP için `radius` mil içindeki hedef ZIP'lerin indekslerini döndürür."""
+        cell, grid = self._grid(radius)
+        targets_by_cell = {key: members[target_mask[members]] for key, members in grid.items()}
+        covers = [None] * len(self.zips)
+
+        for (row, col), members in grid.items():
+            # Yüksek enlemlerde boylam hücreleri daralır; gereken kadar komşu hücreye bak
+            max_lat = min(max(abs(row - 1), abs(row + 2)) * cell, math.radians(89))
+            span = int(math.ceil(1 / math.cos(max_lat)))
+            neighbours = [targets_by_cell.get((row + dr, col + dc)) for dr in (-1, 0, 1) for dc in range(-span, span + 1)]
+            neighbours = np.concatenate([n for n in neighbours if n is not None and len(n)] or [np.array([], dtype=int)])
+
+            if not len(neighbours):
+                for i in members:
+                    covers[i] = neighbours
+                continue
+
+            # Haversine mesafe matrisi: (hücredeki adaylar) x (komşu hedefler)
+            dlat = self.lat[neighbours][None, :] - self.lat[members][:, None]
+            dlon = self.lon[neighbours][None, :] - self.lon[members][:, None]
+            a = np.sin(dlat / 2) ** 2 + np.cos(self.lat[members])[:, None] * np.cos(self.lat[neighbours])[None, :] * np.sin(dlon / 2) ** 2
+            distance = 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+            within = distance <= radius
+            for k, i in enumerate(members):
+                covers[i] = neighbours[within[k]]
+
+        return covers
+
+    def dealer_coverage(self, radius, searches, dealer_zips):
+        """Bilinen bayilerin kaçının planlanan arama daireleri içinde kaldığını tahmin eder.
+
+        Bayinin konumu adresindeki ZIP'in merkezi kabul edilir; koordinatı olmayan bayiler sayılmaz.
+        """
+        counts = Counter(z for z in dealer_zips if z in self.position)
+        located = sum(counts.values())
+        dealer_mask = np.zeros(len(self.zips), dtype=bool)
+        dealer_mask[[self.position[z] for z in counts]] = True
+        covers = self.coverage_sets(radius, dealer_mask)
+
+        covered = set()
+        for zip_code in searches:
+            if zip_code in self.position:
+                covered.update(covers[self.position[zip_code]].tolist())
+        covered_dealers = sum(counts[int(self.zips[i])] for i in covered)
+        return {
+            'known_dealers': len(dealer_zips),
+            'located_dealers': located,
+            'dealer_coverage': covered_dealers / located if located else None,
+        }
+
+    def plan(self, radius, targets, min_gain=1, dealer_zips=None):
+        """Hedef ZIP'leri `radius` mil içinde kapsayan asgari arama ZIP kümesini seçer (açgözlü set cover).
+
+        Yeni bir arama `min_gain`'den az hedef ZIP ekleyecekse durur; böylece kapsama
+        karşılığında istek sayısı azaltılabilir. (arama ZIP'leri, rapor) döndürür.
+        Rapordaki `zip_coverage` yalnızca hedef ZIP merkezlerinin kapsanan payıdır; bilinen
+        bayilerin ZIP'leri (`dealer_zips`) verilirse `dealer_coverage` bayi bazında tahmin edilir.
+        """
+        targets = list(dict.fromkeys(int(z) for z in targets))
+        known = [z for z in targets if z in self.position]
+        # Koordinatı olmayan hedefler kendi başlarına aranır
+        unknown = [z for z in targets if z not in self.position]
+
+        target_mask = np.zeros(len(self.zips), dtype=bool)
+        target_mask[[self.position[z] for z in known]] = True
+        covers = self.coverage_sets(radius, target_mask)
+
+        covered = np.zeros(len(self.zips), dtype=bool)
+        total = int(target_mask.sum())
+        # Tembel açgözlü: kazançlar yalnızca azalabilir, bu yüzden yığından çıkanı yeniden değerlendir
+        heap = [(-len(c), not self.metro[i], i) for i, c in enumerate(covers) if len(c)]
+        heapq.heapify(heap)
+        chosen, curve = [], []
+        covered_count = 0
+
+        while heap and covered_count < total:
+            neg_gain, not_metro, i = heapq.heappop(heap)
+            gain = int((~covered[covers[i]]).sum())
+            if gain != -neg_gain:
+                if gain:
+                    heapq.heappush(heap, (-gain, not_metro, i))
+                continue
+            if gain < min_gain:
+                break
+            covered[covers[i]] = True
+            covered_count += gain
+            chosen.append(int(self.zips[i]))
+            curve.append(covered_count)
+
+        searches = chosen + unknown
+        report = {
+            'radius_miles': radius,
+            'target_zips': len(targets),
+            'planned_searches': len(searches),
+            'zip_coverage': (covered_count + len(unknown)) / len(targets) if targets else 1.0,
+            'request_reduction': len(targets) / len(searches) if searches else float('inf'),
+            # ZIP kapsama eşiklerine ulaşmak için gereken arama sayısı
+            'searches_for_zip_coverage': {
+                f'{int(p * 100)}%': next((k + 1 for k, c in enumerate(curve) if c >= p * total), None)
+                for p in (0.8, 0.9, 0.95, 0.99, 1.0)
+            },
+        }
+        if dealer_zips is not None:
+            report.update(self.dealer_coverage(radius, searches, dealer_zips))
+        return searches, report
+
+
+def print_report(report):
+    print(f"Radius {report['radius_miles']} mi: {report['planned_searches']} searches for "
+          f"{report['target_zips']} target ZIPs ({report['request_reduction']:.1f}x fewer), "
+          f"ZIP coverage {report['zip_coverage']:.1%}")
+    if report.get('dealer_coverage') is not None:
+        print(f"  Dealer coverage {report['dealer_coverage']:.1%} of {report['located_dealers']} "
+              f"located known dealers")
+    for threshold, searches in report['searches_for_zip_coverage'].items():
+        print(f"  {threshold:>4} ZIP coverage: {searches} searches")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan a minimal set of cars.com search ZIPs.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('build', help="rebuild zip_index.csv from the locale workbook")
+    plan = sub.add_parser('plan', help="plan search ZIPs for a radius")
+    plan.add_argument('--radius', type=int, default=50, choices=SEARCH_RADII)
+    plan.add_argument('--targets', default='output.csv', help="CSV with a 'ZIP CODE' column, or 'all' for every indexed ZIP")
+    plan.add_argument('--min-gain', type=int, default=1)
+    plan.add_argument('--dealers', default='dealers.xlsx',
+                      help="known dealers (csv, jsonl, parquet or xlsx) for the dealer coverage estimate")
+    plan.add_argument('--out', default=None, help="write planned ZIPs to this CSV")
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        build_index()
+        return
+
+    planner = ZipPlanner()
+    targets = planner.zips if args.targets == 'all' else pd.read_csv(args.targets)['ZIP CODE'].unique()
+    dealer_zips = load_dealer_zips(args.dealers) if os.path.exists(args.dealers) else None
+    searches, report = planner.plan(args.radius, targets, min_gain=args.min_gain, dealer_zips=dealer_zips)
+    print_report(report)
+    if args.out:
+        pd.DataFrame({'ZIP CODE': searches}).to_csv(args.out, index=False)
+
+
+if __name__ == "__main__":
+    main()